@@ -2,14 +2,12 @@
 
 from __future__ import annotations
 
+import functools
 import re
 from dataclasses import dataclass
 
 from conductor.config import get_config
-from conductor.sessions.detector import (
-    PERMISSION_PROMPT_PATTERNS,
-    has_destructive_keyword,
-)
+from conductor.sessions.detector import has_destructive_keyword, is_permission_prompt
 from conductor.auto.rules import get_active_rules, record_hit
 from conductor.db.models import AutoRule
 from conductor.utils.logger import get_logger
@@ -17,6 +15,70 @@ from conductor.utils.logger import get_logger
 logger = get_logger("conductor.auto.responder")
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_rule_pattern(pattern: str) -> re.Pattern[str] | None:
+    """Compile a regex rule's pattern, or return None if it is invalid.
+
+    Cached on the pattern string, so an edited rule simply gets a new entry.
+    """
+    try:
+        return re.compile(pattern)
+    except re.error:
+        return None
+
+
+@functools.lru_cache(maxsize=32)
+def _contains_scanner(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile literal ``contains`` patterns into one alternation.
+
+    A single search with it tells whether *any* of the patterns occurs, so a
+    miss rules out every contains-rule in one scan of the text.
+    """
+    return re.compile("|".join(map(re.escape, patterns)))
+
+
+@functools.lru_cache(maxsize=32)
+def _regex_scanner(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Compile ``regex`` rule patterns into one alternation, if it is safe to.
+
+    A miss on the alternation means no regex-rule can match, so they can all
+    be skipped after one scan. Returns None (no shortcut) if any pattern is
+    invalid or has groups, since fusing would renumber backreferences, or if
+    the fused pattern does not compile (e.g. a global inline flag).
+    """
+    for pattern in patterns:
+        compiled = _compile_rule_pattern(pattern)
+        if compiled is None or compiled.groups:
+            return None
+    try:
+        return re.compile("|".join(f"(?:{p})" for p in patterns))
+    except re.error:
+        return None
+
+
+@functools.lru_cache(maxsize=32)
+def _lead_chars(patterns: tuple[str, ...]) -> str | None:
+    """Return the distinct first characters of ``contains`` patterns.
+
+    None if any pattern is empty, since an empty pattern occurs in every text.
+    """
+    if not all(patterns):
+        return None
+    return "".join(dict.fromkeys(p[0] for p in patterns))
+
+
+def _contains_absent(text: str, patterns: tuple[str, ...]) -> bool:
+    """Tell whether none of the literal ``patterns`` occurs in ``text``.
+
+    Checks each distinct leading character with ``in`` first (a plain
+    memchr-style scan); only if one is present does the alternation run.
+    """
+    lead = _lead_chars(patterns)
+    if lead is not None and not any(c in text for c in lead):
+        return True
+    return _contains_scanner(patterns).search(text) is None
+
+
 @dataclass
 class AutoResponse:
     should_respond: bool
@@ -44,12 +106,11 @@ class AutoResponder:
             ``block_reason``.
         """
         # Safety: never auto-respond to permission prompts
-        for pattern in PERMISSION_PROMPT_PATTERNS:
-            if re.search(pattern, text, re.MULTILINE):
-                return AutoResponse(
-                    should_respond=False,
-                    block_reason="Permission prompt — requires manual approval",
-                )
+        if is_permission_prompt(text):
+            return AutoResponse(
+                should_respond=False,
+                block_reason="Permission prompt — requires manual approval",
+            )
 
         # Safety: never auto-respond if destructive keywords present
         if has_destructive_keyword(text):
@@ -73,15 +134,13 @@ class AutoResponder:
                 for i, r in enumerate(default_rules)
             ]
 
-        for rule in rules:
-            if not rule.enabled:
-                continue
-            if self._matches(text, rule):
-                return AutoResponse(
-                    should_respond=True,
-                    response=rule.response,
-                    rule_id=rule.id,
-                )
+        rule = self._first_match(text, rules)
+        if rule is not None:
+            return AutoResponse(
+                should_respond=True,
+                response=rule.response,
+                rule_id=rule.id,
+            )
 
         return AutoResponse(should_respond=False)
 
@@ -98,12 +157,11 @@ class AutoResponder:
             ``AutoResponse`` with match result and rule details.
         """
         # Safety checks first (same as sync)
-        for pattern in PERMISSION_PROMPT_PATTERNS:
-            if re.search(pattern, text, re.MULTILINE):
-                return AutoResponse(
-                    should_respond=False,
-                    block_reason="Permission prompt — requires manual approval",
-                )
+        if is_permission_prompt(text):
+            return AutoResponse(
+                should_respond=False,
+                block_reason="Permission prompt — requires manual approval",
+            )
 
         if has_destructive_keyword(text):
             return AutoResponse(
@@ -111,21 +169,56 @@ class AutoResponder:
                 block_reason="Destructive keyword detected",
             )
 
-        rules = await get_active_rules()
-        for rule in rules:
-            if self._matches(text, rule):
-                await record_hit(rule.id)
-                logger.info(
-                    f"Auto-responding to rule #{rule.id}: '{rule.pattern}' → '{rule.response}'"
-                )
-                return AutoResponse(
-                    should_respond=True,
-                    response=rule.response,
-                    rule_id=rule.id,
-                )
+        rule = self._first_match(text, await get_active_rules())
+        if rule is not None:
+            await record_hit(rule.id)
+            logger.info(
+                f"Auto-responding to rule #{rule.id}: '{rule.pattern}' → '{rule.response}'"
+            )
+            return AutoResponse(
+                should_respond=True,
+                response=rule.response,
+                rule_id=rule.id,
+            )
 
         return AutoResponse(should_respond=False)
 
+    @classmethod
+    def _first_match(cls, text: str, rules: list[AutoRule]) -> AutoRule | None:
+        """Return the first enabled rule, in list order, that matches ``text``.
+
+        All ``contains`` patterns, and likewise all ``regex`` patterns, are
+        checked together in one scan first; if that misses, rules of that
+        type are skipped individually.
+
+        Args:
+            text: Terminal output to test.
+            rules: Candidate rules, in priority order.
+
+        Returns:
+            The first matching enabled rule, or None.
+        """
+        enabled = [rule for rule in rules if rule.enabled]
+        if not enabled:
+            return None
+        contains = tuple(
+            rule.pattern for rule in enabled if rule.match_type == "contains"
+        )
+        skip_contains = bool(contains) and _contains_absent(text, contains)
+        regexes = tuple(
+            rule.pattern for rule in enabled if rule.match_type == "regex"
+        )
+        scanner = _regex_scanner(regexes) if regexes else None
+        skip_regex = scanner is not None and scanner.search(text) is None
+        for rule in enabled:
+            if skip_contains and rule.match_type == "contains":
+                continue
+            if skip_regex and rule.match_type == "regex":
+                continue
+            if cls._matches(text, rule):
+                return rule
+        return None
+
     @staticmethod
     def _matches(text: str, rule: AutoRule) -> bool:
         """Check if text matches a single auto-response rule.
@@ -137,13 +230,28 @@ class AutoResponder:
         Returns:
             True if the rule's pattern matches the text.
         """
-        if rule.match_type == "exact":
-            return text.strip() == rule.pattern
-        elif rule.match_type == "regex":
-            try:
-                return bool(re.search(rule.pattern, text))
-            except re.error:
-                logger.warning(f"Invalid regex in rule #{rule.id}: {rule.pattern!r}")
-                return False
-        else:  # contains
-            return rule.pattern in text
+        return _MATCHERS.get(rule.match_type, _match_contains)(text, rule)
+
+
+def _match_exact(text: str, rule: AutoRule) -> bool:
+    return text.strip() == rule.pattern
+
+
+def _match_regex(text: str, rule: AutoRule) -> bool:
+    compiled = _compile_rule_pattern(rule.pattern)
+    if compiled is None:
+        logger.warning(f"Invalid regex in rule #{rule.id}: {rule.pattern!r}")
+        return False
+    return compiled.search(text) is not None
+
+
+def _match_contains(text: str, rule: AutoRule) -> bool:
+    return rule.pattern in text
+
+
+# match_type -> matcher; unknown types fall back to ``contains``
+_MATCHERS = {
+    "exact": _match_exact,
+    "regex": _match_regex,
+    "contains": _match_contains,
+}
@@ -167,7 +167,7 @@ async def handle_permission(callback: CallbackQuery) -> None:
         monitors = get_app_data().get("monitors", {})
         monitor = monitors.get(session_id)
         if monitor and hasattr(monitor, "output_buffer"):
-            lines = monitor.output_buffer.rolling_buffer[-20:]
+            lines = monitor.output_buffer.tail(20)
             text = "\n".join(lines)[:3500]
             await callback.message.answer(
                 f"👀 Context for {session_label(session)}:\n\n<code>{text}</code>",
@@ -1101,7 +1101,7 @@ async def _show_output_inline(callback: CallbackQuery, session, mgr) -> None:
     monitor = monitors.get(session.id)
 
     if monitor and hasattr(monitor, "output_buffer"):
-        lines = monitor.output_buffer.rolling_buffer[-30:]
+        lines = monitor.output_buffer.tail(30)
         if lines:
             text = redact_sensitive("\n".join(lines))
             # Try AI summary
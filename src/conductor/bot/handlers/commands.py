@@ -310,7 +310,7 @@ async def cmd_output(message: Message) -> None:
     monitor = monitors.get(session.id)
 
     if monitor and hasattr(monitor, "output_buffer"):
-        lines = monitor.output_buffer.rolling_buffer[-30:]
+        lines = monitor.output_buffer.tail(30)
         if lines:
             text = redact_sensitive("\n".join(lines))
             # Try AI summary if brain is available
@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from collections import deque
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from aiogram import Bot
@@ -14,22 +18,81 @@ from conductor.utils.logger import get_logger
 
 logger = get_logger("conductor.bot.notifier")
 
+# While the batch buffer is still growing, the flush is deferred in steps of
+# this many seconds (for at most one extra batch window).
+_LINGER_TICK_S = 0.05
+
+# A queued message that fails again is not retried before a backoff of
+# min(_RETRY_BASE_S * 2**retries, _RETRY_CAP_S) seconds has passed.
+_RETRY_BASE_S = 1.0
+_RETRY_CAP_S = 60.0
+
+# A batch is flushed early, without waiting for the window, once it holds this
+# many messages or this many characters (Telegram caps a message at 4096).
+_MAX_BATCH_COUNT = 20
+_MAX_BATCH_CHARS = 3500
+
+# send_message kwargs for the common case (no keyboard, not silent). Shared
+# by every such message, so it is read-only.
+_BASE_KWARGS: Mapping[str, Any] = MappingProxyType({"parse_mode": "HTML"})
+
+
+def _send_kwargs(
+    reply_markup: InlineKeyboardMarkup | None, disable_notification: bool
+) -> Mapping[str, Any]:
+    """Build send_message kwargs, reusing ``_BASE_KWARGS`` when nothing is added."""
+    if not reply_markup and not disable_notification:
+        return _BASE_KWARGS
+    kwargs: dict[str, Any] = dict(_BASE_KWARGS)
+    if reply_markup:
+        kwargs["reply_markup"] = reply_markup
+    if disable_notification:
+        kwargs["disable_notification"] = True
+    return kwargs
+
 
 class Notifier:
     """Notification sender with batching and offline resilience."""
 
+    __slots__ = (
+        "bot",
+        "chat_id",
+        "is_online",
+        "_running",
+        "_batch_window",
+        "_batch_buffer",
+        "_batch_chars",
+        "_batch_task",
+        "_flush_task",
+        "_queue",
+        "_max_retries",
+    )
+
     def __init__(self, bot: Bot, chat_id: int) -> None:
         self.bot = bot
         self.chat_id = chat_id
-        self._queue: asyncio.Queue[tuple[str, dict[str, Any], int]] = asyncio.Queue()
+        # Offline queue items: (text, kwargs, retries, next_attempt_monotonic).
+        # Only touched from the event loop and never waited on, so a plain
+        # deque is enough.
+        self._queue: deque[tuple[str, Mapping[str, Any], int, float]] = deque()
         self._max_retries = 5
-        self._batch_buffer: list[tuple[str, dict[str, Any]]] = []
+        self._batch_buffer: deque[tuple[str, Mapping[str, Any]]] = deque()
+        self._batch_chars = 0  # Total text length currently in _batch_buffer
         self._batch_task: asyncio.Task | None = None
+        self._flush_task: asyncio.Task | None = None  # Early flush of a full batch
         self._running = False
         self.is_online = True
 
-        cfg = get_config()
-        self._batch_window = cfg.batch_window_s
+        self._batch_window: float = 0
+        self.reload_config()
+
+    def reload_config(self) -> None:
+        """Re-read ``batch_window_s`` from config.
+
+        The value is cached on the instance so ``send`` does not look up the
+        config per message; call this after the config changes.
+        """
+        self._batch_window = get_config().batch_window_s
 
     async def start(self) -> None:
         """Start the background batch flusher loop."""
@@ -45,6 +108,8 @@ class Notifier:
                 await self._batch_task
             except asyncio.CancelledError:
                 pass
+        if self._flush_task:
+            await self._flush_task
         await self._flush_batch()
 
     async def send(
@@ -56,7 +121,10 @@ class Notifier:
         """Queue a notification for batched delivery.
 
         Messages are buffered and combined if multiple arrive within the batch
-        window. If the batch window is 0, sends immediately.
+        window. If the batch window is 0, sends immediately. A batch that
+        reaches ``_MAX_BATCH_COUNT`` messages or ``_MAX_BATCH_CHARS``
+        characters is flushed right away in a background task, so the caller
+        never waits on the send.
 
         Args:
             text: Message text (HTML). Sensitive data is auto-redacted.
@@ -67,17 +135,19 @@ class Notifier:
             Message ID if sent immediately, or None if batched for later.
         """
         text = redact_sensitive(text)
-        kwargs: dict[str, Any] = {"parse_mode": "HTML"}
-        if reply_markup:
-            kwargs["reply_markup"] = reply_markup
-        if disable_notification:
-            kwargs["disable_notification"] = True
+        kwargs = _send_kwargs(reply_markup, disable_notification)
 
         # If batch window is 0 or only one message, send immediately
         if self._batch_window <= 0:
             return await self._send_direct(text, kwargs)
 
         self._batch_buffer.append((text, kwargs))
+        self._batch_chars += len(text)
+        if (
+            len(self._batch_buffer) >= _MAX_BATCH_COUNT
+            or self._batch_chars >= _MAX_BATCH_CHARS
+        ) and (self._flush_task is None or self._flush_task.done()):
+            self._flush_task = asyncio.create_task(self._flush_batch())
         return None
 
     async def send_immediate(
@@ -99,14 +169,10 @@ class Notifier:
             Message ID on success, or None if offline (message queued).
         """
         text = redact_sensitive(text)
-        kwargs: dict[str, Any] = {"parse_mode": "HTML"}
-        if reply_markup:
-            kwargs["reply_markup"] = reply_markup
-        if disable_notification:
-            kwargs["disable_notification"] = True
+        kwargs = _send_kwargs(reply_markup, disable_notification)
         return await self._send_direct(text, kwargs)
 
-    async def _send_direct(self, text: str, kwargs: dict) -> int | None:
+    async def _send_direct(self, text: str, kwargs: Mapping[str, Any]) -> int | None:
         """Attempt direct send to Telegram with 429 backoff; queue if offline."""
         backoff = 1.0
         max_backoff = 30.0
@@ -126,21 +192,39 @@ class Notifier:
                     backoff = min(backoff * 2, max_backoff)
                     continue
                 self.is_online = False
-                await self._queue.put((text, kwargs, 1))
+                self._queue.append((text, kwargs, 1, 0.0))
                 logger.warning(
-                    f"Queued notification (offline): {e}. Queue: {self._queue.qsize()}"
+                    f"Queued notification (offline): {e}. Queue: {len(self._queue)}"
                 )
                 return None
         # All retries exhausted
-        await self._queue.put((text, kwargs, 1))
+        self._queue.append((text, kwargs, 1, 0.0))
         return None
 
     async def _batch_loop(self) -> None:
         """Background loop that flushes the batch buffer at regular intervals."""
         while self._running:
             await asyncio.sleep(self._batch_window)
+            await self._linger()
             await self._flush_batch()
 
+    async def _linger(self) -> None:
+        """Defer a flush while messages are still arriving.
+
+        Checks the buffer every ``_LINGER_TICK_S`` and returns as soon as it
+        stops growing, so a burst is delivered as one combined message. The
+        extra wait is capped at one batch window.
+        """
+        size = len(self._batch_buffer)
+        waited = 0.0
+        while size and waited < self._batch_window:
+            await asyncio.sleep(_LINGER_TICK_S)
+            waited += _LINGER_TICK_S
+            grown = len(self._batch_buffer)
+            if grown == size:
+                return
+            size = grown
+
     async def _flush_batch(self) -> None:
         """Flush all buffered messages.
 
@@ -150,26 +234,31 @@ class Notifier:
         if not self._batch_buffer:
             return
 
-        items = self._batch_buffer[:]
+        items = list(self._batch_buffer)
         self._batch_buffer.clear()
+        self._batch_chars = 0
 
         if len(items) == 1:
             text, kwargs = items[0]
             await self._send_direct(text, kwargs)
         else:
             # C4: Send messages with keyboards separately to preserve reply_markup
-            keyboard_items = [(t, k) for t, k in items if "reply_markup" in k]
-            plain_items = [(t, k) for t, k in items if "reply_markup" not in k]
+            keyboard_items: list[tuple[str, Mapping[str, Any]]] = []
+            plain_items: list[tuple[str, Mapping[str, Any]]] = []
+            for item in items:
+                if "reply_markup" in item[1]:
+                    keyboard_items.append(item)
+                else:
+                    plain_items.append(item)
 
             # Combine plain text messages into one
             if plain_items:
                 if len(plain_items) == 1:
                     await self._send_direct(plain_items[0][0], plain_items[0][1])
                 else:
-                    combined = f"📬 {len(plain_items)} Updates:\n\n"
-                    combined += "\n\n".join(text for text, _ in plain_items)
-                    kwargs = plain_items[0][1].copy()
-                    await self._send_direct(combined, kwargs)
+                    body = "\n\n".join([text for text, _ in plain_items])
+                    combined = f"📬 {len(plain_items)} Updates:\n\n{body}"
+                    await self._send_direct(combined, plain_items[0][1])
 
             # Send keyboard messages individually
             for text, kwargs in keyboard_items:
@@ -179,16 +268,28 @@ class Notifier:
         """Send all queued messages accumulated during offline periods.
 
         Processes the queue sequentially with a 100ms delay between sends
-        to respect Telegram rate limits. Stops on first failure.
+        to respect Telegram rate limits. Messages still inside their retry
+        backoff are skipped and kept. Stops on first failure. Another drain
+        may run concurrently, so the queue is re-checked before each pop.
         """
-        while not self._queue.empty():
-            text, kwargs, retries = await self._queue.get()
+        now = time.monotonic()
+        for _ in range(len(self._queue)):
+            if not self._queue:
+                break
+            item = self._queue.popleft()
+            text, kwargs, retries, next_attempt = item
+            if now < next_attempt:
+                self._queue.append(item)
+                continue
             try:
                 await self.bot.send_message(self.chat_id, text, **kwargs)
                 await asyncio.sleep(0.1)  # Respect rate limits
             except Exception:
                 if retries < self._max_retries:
-                    await self._queue.put((text, kwargs, retries + 1))
+                    backoff = min(_RETRY_BASE_S * 2**retries, _RETRY_CAP_S)
+                    self._queue.append(
+                        (text, kwargs, retries + 1, time.monotonic() + backoff)
+                    )
                 else:
                     logger.warning(f"Discarding message after {retries} retries")
                 break
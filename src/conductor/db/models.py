@@ -69,7 +69,7 @@ class Command:
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
-@dataclass
+@dataclass(slots=True)
 class AutoRule:
     """An auto-response rule for terminal prompt matching.
 
@@ -4,6 +4,11 @@ from __future__ import annotations
 
 import re
 
+try:
+    import re2 as _regex
+except ImportError:  # optional: google-re2 guarantees linear-time matching
+    _regex = re
+
 REDACTION_PATTERNS: list[tuple[str, str]] = [
     # Anthropic API keys
     (r"sk-ant-api\S+", "[REDACTED:ANTHROPIC_KEY]"),
@@ -29,7 +34,43 @@ REDACTION_PATTERNS: list[tuple[str, str]] = [
     (r"^[A-Z_]+=(sk-|key-|ghp_|gho_|npm_)\S+$", "[REDACTED:ENV_LINE]"),
 ]
 
-_compiled = [(re.compile(p, re.MULTILINE), r) for p, r in REDACTION_PATTERNS]
+# Lower-case substrings, one of which occurs in the lower-cased form of any
+# text a case-sensitive pattern above can match. Keep in sync with
+# REDACTION_PATTERNS.
+_ANCHORS: tuple[str, ...] = (
+    "sk-",
+    "key-",
+    "ghp_",
+    "gho_",
+    "npm_",
+    "akia",
+    "xox",
+    "-----begin ",
+    "bearer",
+)
+
+# The env-secret keywords match under Unicode case folding (e.g. "ſecret"),
+# which str.lower() does not reproduce, so they get their own (?i) check.
+_ENV_SECRET_KEYS = re.compile(r"(?i)password|secret|token|api_key")
+
+# Applied one after another, in list order: later patterns see the output of
+# earlier ones, so adjacent or overlapping secrets are all caught. The patterns
+# avoid backreferences and lookarounds so RE2 accepts them too; MULTILINE is
+# set inline because re2.compile() takes no re-style flags.
+def _compile_patterns(engine) -> list[tuple[re.Pattern[str], str]]:
+    """Compile ``REDACTION_PATTERNS`` with ``engine`` (``re`` or ``re2``).
+
+    Case-insensitive patterns always use ``re``: RE2's case folding differs
+    from Python's (it does not match ``ı`` against ``i``, for one), and a
+    missed fold would leak a secret that stdlib ``re`` catches.
+    """
+    return [
+        ((re if p.startswith("(?i)") else engine).compile("(?m)" + p), r)
+        for p, r in REDACTION_PATTERNS
+    ]
+
+
+_COMPILED = _compile_patterns(_regex)
 
 
 def redact_sensitive(text: str) -> str:
@@ -44,6 +85,12 @@ def redact_sensitive(text: str) -> str:
     Returns:
         Text with all matched patterns replaced by ``[REDACTED:...]`` placeholders.
     """
-    for pattern, replacement in _compiled:
+    lowered = text.lower()
+    if (
+        not any(anchor in lowered for anchor in _ANCHORS)
+        and _ENV_SECRET_KEYS.search(text) is None
+    ):
+        return text
+    for pattern, replacement in _COMPILED:
         text = pattern.sub(replacement, text)
     return text
@@ -115,6 +115,10 @@ def _match_any(text: str, name: str, patterns: list[str]) -> tuple[bool, str, st
     return False, "", ""
 
 
+def is_permission_prompt(text: str) -> bool:
+    return _match_any(text, "perm", PERMISSION_PROMPT_PATTERNS)[0]
+
+
 def has_destructive_keyword(text: str) -> bool:
     text_lower = text.lower()
     return any(kw in text_lower for kw in DESTRUCTIVE_KEYWORDS)
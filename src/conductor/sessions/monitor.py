@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import time
 from datetime import datetime
 
@@ -17,6 +18,18 @@ from conductor.utils.logger import get_logger
 logger = get_logger("conductor.sessions.monitor")
 
 
+@functools.lru_cache(maxsize=32)
+def _poll_intervals(
+    poll_ms: float, active_ms: float, idle_ms: float, threshold_s: float
+) -> tuple[float, float, float, float]:
+    """Convert monitor config values to ``(default, active, idle, threshold)`` seconds.
+
+    Cached on the raw config values, so every monitor built from the same
+    config reuses one computed tuple.
+    """
+    return poll_ms / 1000, active_ms / 1000, idle_ms / 1000, threshold_s
+
+
 class OutputMonitor:
     """Watch a tmux pane for output and detect patterns."""
 
@@ -40,10 +53,17 @@ class OutputMonitor:
         self._last_completion_buffer_len: int = 0
 
         cfg = get_config().monitor_config
-        self._poll_default = cfg.get("poll_interval_ms", 500) / 1000
-        self._poll_active = cfg.get("active_poll_interval_ms", 300) / 1000
-        self._poll_idle = cfg.get("idle_poll_interval_ms", 2000) / 1000
-        self._completion_threshold = cfg.get("completion_idle_threshold_s", 30)
+        (
+            self._poll_default,
+            self._poll_active,
+            self._poll_idle,
+            self._completion_threshold,
+        ) = _poll_intervals(
+            cfg.get("poll_interval_ms", 500),
+            cfg.get("active_poll_interval_ms", 300),
+            cfg.get("idle_poll_interval_ms", 2000),
+            cfg.get("completion_idle_threshold_s", 30),
+        )
 
     @property
     def poll_interval(self) -> float:
@@ -111,7 +131,7 @@ class OutputMonitor:
         if current_len <= self._last_completion_buffer_len:
             return
 
-        recent = self.output_buffer.rolling_buffer[-10:]
+        recent = self.output_buffer.tail(10)
         if not recent:
             return
 
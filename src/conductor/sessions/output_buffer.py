@@ -3,20 +3,37 @@
 from __future__ import annotations
 
 import re
-import zlib
-from collections import OrderedDict
+from collections import deque
+from collections.abc import Iterable
+from itertools import islice
 
 _ANSI_RE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+# Colour/style (SGR) sequences, by far the most common escapes in pane output.
+_SGR_RE = re.compile(r"\x1B\[[0-9;]*m")
+
+# Number of recent line hashes remembered for deduplication.
+_MAX_SEEN_HASHES = 10000
 
 
 class OutputBuffer:
     """Manages deduplicated output capture from a tmux pane."""
 
+    __slots__ = (
+        "_hash_order",
+        "_hash_set",
+        "last_capture_length",
+        "max_lines",
+        "_rolling",
+    )
+
     def __init__(self, max_lines: int = 5000) -> None:
-        self.seen_line_hashes: OrderedDict[int, None] = OrderedDict()
+        # Insertion order lives in the deque (for eviction), membership in the
+        # set; both always hold the same hashes.
+        self._hash_order: deque[int] = deque()
+        self._hash_set: set[int] = set()
         self.last_capture_length: int = 0
-        self.rolling_buffer: list[str] = []
         self.max_lines = max_lines
+        self._rolling: deque[str] = deque(maxlen=max_lines)
 
     def get_new_lines(self, pane) -> list[str]:
         """Capture and return only truly new, deduplicated lines from a tmux pane."""
@@ -25,40 +42,87 @@ class OutputBuffer:
         except Exception:
             return []
 
-        cleaned = [self._strip_ansi(line) for line in raw]
-
-        if len(cleaned) < self.last_capture_length:
+        if len(raw) < self.last_capture_length:
             self.last_capture_length = 0
 
-        if len(cleaned) <= self.last_capture_length:
+        if len(raw) <= self.last_capture_length:
             return []
 
-        new_lines = cleaned[self.last_capture_length :]
-        self.last_capture_length = len(cleaned)
+        # Only the tail past the previous capture is new; strip just that part.
+        # Lines without ESC skip the _strip_ansi call entirely.
+        strip = self._strip_ansi
+        new_lines = [
+            strip(line) if "\x1b" in line else line
+            for line in raw[self.last_capture_length :]
+        ]
+        self.last_capture_length = len(raw)
 
-        truly_new = []
-        for line in new_lines:
-            line_hash = zlib.crc32(line.encode())
-            if line_hash not in self.seen_line_hashes:
-                self.seen_line_hashes[line_hash] = None
-                truly_new.append(line)
-
-        while len(self.seen_line_hashes) > 10000:
-            self.seen_line_hashes.popitem(last=False)
-
-        self.rolling_buffer.extend(truly_new)
-        if len(self.rolling_buffer) > self.max_lines:
-            self.rolling_buffer = self.rolling_buffer[-self.max_lines :]
+        # hash() is salted per process, which is fine for an in-memory set,
+        # and skips the encode() a checksum such as crc32 would need.
+        truly_new = [line for line in new_lines if self._remember(hash(line))]
 
+        self._rolling.extend(truly_new)
         return truly_new
 
+    @property
+    def rolling_buffer(self) -> deque[str]:
+        """The latest ``max_lines`` deduplicated lines, oldest first.
+
+        Older lines drop off automatically as new ones are appended.
+        """
+        return self._rolling
+
+    @rolling_buffer.setter
+    def rolling_buffer(self, lines: Iterable[str]) -> None:
+        self._rolling = deque(lines, maxlen=self.max_lines)
+
+    def tail(self, n: int) -> list[str]:
+        """Return the last ``n`` lines of the rolling buffer, oldest first."""
+        lines = list(islice(reversed(self._rolling), n))
+        lines.reverse()
+        return lines
+
+    @property
+    def seen_line_hashes(self) -> set[int]:
+        """Hashes of the most recent distinct lines.
+
+        This is the live set used for deduplication, not a copy; do not modify
+        it, or it falls out of step with the eviction order.
+        """
+        return self._hash_set
+
+    def _remember(self, line_hash: int) -> bool:
+        """Record ``line_hash`` as seen, evicting the oldest hash when full.
+
+        Returns:
+            True if the hash was new, False if it had already been seen.
+        """
+        if line_hash in self._hash_set:
+            return False
+        if len(self._hash_order) >= _MAX_SEEN_HASHES:
+            self._hash_set.discard(self._hash_order.popleft())
+        self._hash_order.append(line_hash)
+        self._hash_set.add(line_hash)
+        return True
+
     def reset(self) -> None:
         """Reset buffer state, clearing all hashes and captured lines."""
-        self.seen_line_hashes.clear()
+        self._hash_order.clear()
+        self._hash_set.clear()
         self.last_capture_length = 0
-        self.rolling_buffer.clear()
+        self._rolling.clear()
 
     @staticmethod
     def _strip_ansi(text: str) -> str:
-        """Remove ANSI escape codes."""
+        """Remove ANSI escape codes.
+
+        Lines without ESC are returned as-is. SGR sequences are stripped with
+        a small dedicated regex first; the general one runs only if other
+        escapes remain.
+        """
+        if "\x1b" not in text:
+            return text
+        text = _SGR_RE.sub("", text)
+        if "\x1b" not in text:
+            return text
         return _ANSI_RE.sub("", text)
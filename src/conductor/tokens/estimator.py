@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+from collections import Counter
 from datetime import datetime
 
 from conductor.config import get_config
@@ -9,6 +11,29 @@ from conductor.utils.logger import get_logger
 
 logger = get_logger("conductor.tokens.estimator")
 
+# Threshold levels in ascending severity, with their config keys and defaults.
+_THRESHOLD_LEVELS: tuple[tuple[str, str, int], ...] = (
+    ("warning", "warning_pct", 80),
+    ("danger", "danger_pct", 90),
+    ("critical", "critical_pct", 95),
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _threshold_for(pct: int, cutoffs: tuple[int, ...]) -> str | None:
+    """Return the most severe threshold level reached by ``pct``, or None.
+
+    ``cutoffs`` holds the configured percentage of each ``_THRESHOLD_LEVELS``
+    entry, in the same order. Keyed on them as well, so a config change never
+    returns a stale level.
+    """
+    # Most severe level first, as the original if/elif chain checked them, so
+    # the result does not depend on the cutoffs being in ascending order.
+    for (level, _, _), cutoff in zip(reversed(_THRESHOLD_LEVELS), reversed(cutoffs)):
+        if pct >= cutoff:
+            return level
+    return None
+
 
 class TokenEstimator:
     """Estimate token usage based on observable message exchanges."""
@@ -21,10 +46,25 @@ class TokenEstimator:
 
     def __init__(self) -> None:
         cfg = get_config()
+        # used -> percentage for the current tier; cleared on tier change/reset
+        self._pct_cache: dict[int, int] = {}
         self.tier = cfg.plan_tier
-        self.message_counts: dict[str, int] = {}
+        self.message_counts: Counter[str] = Counter()
+        self._total = 0  # sum(message_counts.values()), kept in step
         self.window_start: datetime | None = None
 
+    @property
+    def tier(self) -> str:
+        """Plan tier name, a key of ``LIMITS``."""
+        return self._tier
+
+    @tier.setter
+    def tier(self, value: str) -> None:
+        self._tier = value
+        # Unknown tiers fall back to the pro limit
+        self._limit: int = self.LIMITS.get(value, self.LIMITS["pro"])["messages"]
+        self._pct_cache.clear()
+
     def on_claude_response(self, session_id: str) -> None:
         """Record a message exchange (response from Claude).
 
@@ -37,9 +77,8 @@ class TokenEstimator:
             if elapsed >= 5 * 3600:
                 self.reset_window()
 
-        if session_id not in self.message_counts:
-            self.message_counts[session_id] = 0
         self.message_counts[session_id] += 1
+        self._total += 1
 
         if self.window_start is None:
             self.window_start = datetime.now()
@@ -56,14 +95,13 @@ class TokenEstimator:
             ``'percentage'`` (int 0-100), ``'reset_in_seconds'`` (float or None),
             ``'tier'`` (str).
         """
-        limit = self.LIMITS.get(self.tier, self.LIMITS["pro"])["messages"]
-
-        if session_id:
-            used = self.message_counts.get(session_id, 0)
-        else:
-            used = sum(self.message_counts.values())
+        limit = self._limit
+        used = self.message_counts[session_id] if session_id else self._total
 
-        pct = min(100, int((used / limit) * 100)) if limit > 0 else 0
+        pct = self._pct_cache.get(used)
+        if pct is None:
+            pct = min(100, int((used / limit) * 100)) if limit > 0 else 0
+            self._pct_cache[used] = pct
 
         reset_seconds = None
         if self.window_start:
@@ -84,21 +122,11 @@ class TokenEstimator:
         Returns:
             ``'critical'``, ``'danger'``, ``'warning'``, or ``None`` if below all thresholds.
         """
-        cfg = get_config()
-        usage = self.get_usage()
-        pct = usage["percentage"]
-
-        critical = cfg.tokens_config.get("critical_pct", 95)
-        danger = cfg.tokens_config.get("danger_pct", 90)
-        warning = cfg.tokens_config.get("warning_pct", 80)
-
-        if pct >= critical:
-            return "critical"
-        elif pct >= danger:
-            return "danger"
-        elif pct >= warning:
-            return "warning"
-        return None
+        tokens_cfg = get_config().tokens_config
+        cutoffs = tuple(
+            tokens_cfg.get(key, default) for _, key, default in _THRESHOLD_LEVELS
+        )
+        return _threshold_for(self.get_usage()["percentage"], cutoffs)
 
     def detect_message_boundary(self, idle_seconds: float, new_line_count: int) -> bool:
         """Detect when Claude Code has completed a response.
@@ -115,4 +143,6 @@ class TokenEstimator:
     def reset_window(self) -> None:
         """Reset all message counts and the tracking window start time."""
         self.message_counts.clear()
+        self._total = 0
+        self._pct_cache.clear()
         self.window_start = None
@@ -10,6 +10,22 @@ from conductor.utils.logger import get_logger
 logger = get_logger("conductor.utils.sleep")
 
 
+async def _noop_wake(sleep_duration: float) -> None:
+    """Wake callback used when none is configured."""
+
+
+def _safe(callback):
+    """Wrap an async wake callback so its errors are logged, not raised."""
+
+    async def wrapper(sleep_duration: float) -> None:
+        try:
+            await callback(sleep_duration)
+        except Exception as e:
+            logger.error(f"Wake callback error: {e}")
+
+    return wrapper
+
+
 class SleepHandler:
     """Detect Mac sleep/wake by monitoring time gaps."""
 
@@ -19,15 +35,27 @@ class SleepHandler:
         check_interval: float = 5.0,
         sleep_threshold: float = 15.0,
     ) -> None:
-        self._on_wake = on_wake_callback
+        self._on_wake = _safe(on_wake_callback) if on_wake_callback else _noop_wake
         self._check_interval = check_interval
         self._sleep_threshold = sleep_threshold
+        # Gap checks run on integer nanoseconds from time.monotonic_ns()
+        self._check_interval_ns = int(check_interval * 1e9)
+        self._sleep_threshold_ns = int(sleep_threshold * 1e9)
         self._task: asyncio.Task | None = None
-        self._last_check: float = time.monotonic()
+        self._last_check_ns: int = time.monotonic_ns()
+
+    @property
+    def _last_check(self) -> float:
+        """Time of the last check in ``time.monotonic()`` seconds."""
+        return self._last_check_ns / 1e9
+
+    @_last_check.setter
+    def _last_check(self, value: float) -> None:
+        self._last_check_ns = int(value * 1e9)
 
     async def start(self) -> None:
         """Start the background sleep detection loop."""
-        self._last_check = time.monotonic()
+        self._last_check_ns = time.monotonic_ns()
         self._task = asyncio.create_task(self._monitor_loop())
         logger.info("Sleep handler started")
 
@@ -49,17 +77,17 @@ class SleepHandler:
         """
         while True:
             await asyncio.sleep(self._check_interval)
-            now = time.monotonic()
-            elapsed = now - self._last_check
+            now = time.monotonic_ns()
+            elapsed = now - self._last_check_ns
 
-            if elapsed > self._sleep_threshold:
-                sleep_duration = elapsed - self._check_interval
+            if elapsed > self._sleep_threshold_ns:
+                sleep_duration = (elapsed - self._check_interval_ns) / 1e9
                 logger.warning(
                     f"Mac wake detected — system was asleep for ~{sleep_duration:.0f}s"
                 )
                 await self._handle_wake(sleep_duration)
 
-            self._last_check = now
+            self._last_check_ns = now
 
     async def _handle_wake(self, sleep_duration: float) -> None:
         """Handle a detected wake event.
@@ -67,8 +95,4 @@ class SleepHandler:
         Args:
             sleep_duration: Estimated seconds the system was asleep.
         """
-        if self._on_wake:
-            try:
-                await self._on_wake(sleep_duration)
-            except Exception as e:
-                logger.error(f"Wake callback error: {e}")
+        await self._on_wake(sleep_duration)
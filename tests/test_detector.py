@@ -1,7 +1,11 @@
 """Tests for pattern detection — Section 18.2."""
 
 import pytest
-from conductor.sessions.detector import PatternDetector, has_destructive_keyword
+from conductor.sessions.detector import (
+    PatternDetector,
+    has_destructive_keyword,
+    is_permission_prompt,
+)
 
 
 @pytest.fixture
@@ -110,3 +114,12 @@ class TestDestructiveKeywords:
     def test_normal_text_not_destructive(self):
         assert has_destructive_keyword("Run tests") is False
         assert has_destructive_keyword("Build succeeded") is False
+
+
+class TestPermissionPrompt:
+    def test_detects_permission_prompt(self):
+        assert is_permission_prompt("Claude wants to edit main.py") is True
+        assert is_permission_prompt("Overwrite? [y/n]") is True
+
+    def test_normal_text_not_permission_prompt(self):
+        assert is_permission_prompt("Build succeeded") is False
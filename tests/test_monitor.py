@@ -1,13 +1,14 @@
 """Tests for OutputMonitor — async polling loop for tmux pane output."""
 
 import asyncio
-import time
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
+import pytest
 
 from conductor.db.models import Session
 from conductor.sessions.detector import DetectionResult
 from conductor.sessions.monitor import OutputMonitor
+from conductor.sessions.output_buffer import OutputBuffer
 
 
 def _make_session(**overrides) -> Session:
@@ -26,6 +27,16 @@ def _make_session(**overrides) -> Session:
     return Session(**defaults)
 
 
+class _Recorder:
+    """Awaitable on_event stand-in that logs each call's positional args."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple] = []
+
+    async def __call__(self, *args) -> None:
+        self.calls.append(args)
+
+
 def _make_monitor(session=None, on_event=None, monitor_cfg=None):
     """Build an OutputMonitor with a mock pane and patched config."""
     if session is None:
@@ -54,46 +65,29 @@ def _make_monitor(session=None, on_event=None, monitor_cfg=None):
 # ---------------------------------------------------------------------------
 
 
-class TestPollInterval:
-    def test_paused_returns_5(self):
-        """Paused session always gets the slow 5-second poll interval."""
-        monitor = _make_monitor(session=_make_session(status="paused"))
-        assert monitor.poll_interval == 5.0
-
-    def test_idle_over_300_returns_idle_interval(self):
-        """When idle_seconds exceeds 300, use the configured idle interval."""
-        monitor = _make_monitor()
-        monitor.idle_seconds = 301
-        assert monitor.poll_interval == 2.0  # 2000ms / 1000
-
-    def test_active_output_returns_active_interval(self):
-        """While actively receiving output, poll at the faster active rate."""
-        monitor = _make_monitor()
-        monitor.active_output = True
-        monitor.idle_seconds = 0
-        assert monitor.poll_interval == 0.3  # 300ms / 1000
-
-    def test_default_returns_default_interval(self):
-        """With no special conditions, poll at the default rate."""
-        monitor = _make_monitor()
-        monitor.active_output = False
-        monitor.idle_seconds = 0
-        assert monitor.poll_interval == 0.5  # 500ms / 1000
+# (session status, active_output, idle_seconds) -> expected poll interval.
+# Rows are ordered by branch priority: paused > idle > active > default.
+INTERVAL_TABLE = {
+    ("paused", False, 0): 5.0,
+    ("paused", True, 0): 5.0,
+    ("running", False, 301): 2.0,  # idle_poll_interval_ms / 1000
+    ("running", True, 400): 2.0,  # idle beats active_output
+    ("running", True, 0): 0.3,  # active_poll_interval_ms / 1000
+    ("running", False, 0): 0.5,  # poll_interval_ms / 1000
+}
 
-    def test_paused_takes_priority_over_active(self):
-        """Paused status takes priority even when active_output is True."""
-        monitor = _make_monitor(session=_make_session(status="paused"))
-        monitor.active_output = True
-        monitor.idle_seconds = 0
-        assert monitor.poll_interval == 5.0
 
-    def test_idle_over_300_takes_priority_over_active(self):
-        """High idle_seconds takes priority over active_output flag."""
-        monitor = _make_monitor()
-        monitor.idle_seconds = 400
-        monitor.active_output = True
-        # idle_seconds > 300 is checked before active_output
-        assert monitor.poll_interval == 2.0
+class TestPollInterval:
+    @pytest.mark.parametrize(
+        "status, active, idle_seconds, expected",
+        [(*key, expected) for key, expected in INTERVAL_TABLE.items()],
+    )
+    def test_interval_table(self, status, active, idle_seconds, expected):
+        """poll_interval follows the INTERVAL_TABLE decision table."""
+        monitor = _make_monitor(session=_make_session(status=status))
+        monitor.active_output = active
+        monitor.idle_seconds = idle_seconds
+        assert monitor.poll_interval == expected
 
     def test_custom_config_values(self):
         """Monitor respects non-default config values for poll intervals."""
@@ -116,22 +110,24 @@ class TestPollInterval:
 
 
 class TestStartStop:
-    async def test_stop_event_interrupts_sleep(self):
-        """Calling stop() should interrupt the wait_for sleep immediately (C1 fix)."""
+    async def test_stop_event_interrupts_sleep(self, monkeypatch):
+        """The loop sleeps on _stop_event.wait(), so stop() interrupts it (C1 fix)."""
         monitor = _make_monitor()
-        monitor.output_buffer.get_new_lines = MagicMock(return_value=[])
+        get_new_lines = MagicMock(return_value=[])
+        monkeypatch.setattr(OutputBuffer, "get_new_lines", get_new_lines)
+        waited = []
 
-        async def stop_after_short_delay():
-            await asyncio.sleep(0.05)
-            await monitor.stop()
+        async def fake_wait_for(aw, timeout):
+            waited.append((aw.__qualname__, timeout))
+            aw.close()
+            monitor._stop_event.set()
 
-        start_time = time.monotonic()
-        # Run start() and stop concurrently; stop should interrupt quickly
-        await asyncio.gather(monitor.start(), stop_after_short_delay())
-        elapsed = time.monotonic() - start_time
+        monkeypatch.setattr(
+            "conductor.sessions.monitor.asyncio.wait_for", fake_wait_for
+        )
+        await monitor.start()
 
-        # Should complete well under 1 second (poll_interval is 0.5s)
-        assert elapsed < 0.5
+        assert waited == [("Event.wait", monitor.poll_interval)]
 
     async def test_stop_sets_event(self):
         """stop() sets the internal _stop_event."""
@@ -140,11 +136,12 @@ class TestStartStop:
         await monitor.stop()
         assert monitor._stop_event.is_set()
 
-    async def test_start_clears_stop_event(self):
+    async def test_start_clears_stop_event(self, monkeypatch):
         """start() clears _stop_event so the loop can run again."""
         monitor = _make_monitor()
         monitor._stop_event.set()
-        monitor.output_buffer.get_new_lines = MagicMock(return_value=[])
+        get_new_lines = MagicMock(return_value=[])
+        monkeypatch.setattr(OutputBuffer, "get_new_lines", get_new_lines)
 
         async def stop_soon():
             await asyncio.sleep(0.05)
@@ -153,9 +150,9 @@ class TestStartStop:
         # start() should clear the event and loop at least once
         await asyncio.gather(monitor.start(), stop_soon())
         # get_new_lines must have been called at least once
-        assert monitor.output_buffer.get_new_lines.call_count >= 1
+        assert get_new_lines.call_count >= 1
 
-    async def test_loop_polls_multiple_times(self):
+    async def test_loop_polls_multiple_times(self, monkeypatch):
         """The loop should poll get_new_lines repeatedly until stopped."""
         cfg = {
             "poll_interval_ms": 20,
@@ -164,7 +161,8 @@ class TestStartStop:
             "completion_idle_threshold_s": 30,
         }
         monitor = _make_monitor(monitor_cfg=cfg)
-        monitor.output_buffer.get_new_lines = MagicMock(return_value=[])
+        get_new_lines = MagicMock(return_value=[])
+        monkeypatch.setattr(OutputBuffer, "get_new_lines", get_new_lines)
 
         async def stop_after_polls():
             await asyncio.sleep(0.15)
@@ -172,7 +170,7 @@ class TestStartStop:
 
         await asyncio.gather(monitor.start(), stop_after_polls())
         # With 20ms interval and 150ms runtime, expect several polls
-        assert monitor.output_buffer.get_new_lines.call_count >= 3
+        assert get_new_lines.call_count >= 3
 
 
 # ---------------------------------------------------------------------------
@@ -181,13 +179,14 @@ class TestStartStop:
 
 
 class TestIdleTracking:
-    async def test_idle_seconds_resets_on_new_output(self):
+    async def test_idle_seconds_resets_on_new_output(self, monkeypatch):
         """When new lines arrive, idle_seconds must reset to 0."""
         monitor = _make_monitor()
         monitor.idle_seconds = 100
         monitor.detector = MagicMock()
         monitor.detector.classify.return_value = DetectionResult(type="none")
-        monitor.output_buffer.get_new_lines = MagicMock(side_effect=[["line1"], []])
+        get_new_lines = MagicMock(side_effect=[["line1"], []])
+        monkeypatch.setattr(OutputBuffer, "get_new_lines", get_new_lines)
 
         async def stop_after():
             await asyncio.sleep(0.05)
@@ -199,7 +198,7 @@ class TestIdleTracking:
         # but must not still be 100
         assert monitor.idle_seconds < 10
 
-    async def test_idle_seconds_accumulates_when_no_output(self):
+    async def test_idle_seconds_accumulates_when_no_output(self, monkeypatch):
         """idle_seconds should grow when no new lines arrive."""
         cfg = {
             "poll_interval_ms": 20,
@@ -208,7 +207,8 @@ class TestIdleTracking:
             "completion_idle_threshold_s": 9999,
         }
         monitor = _make_monitor(monitor_cfg=cfg)
-        monitor.output_buffer.get_new_lines = MagicMock(return_value=[])
+        get_new_lines = MagicMock(return_value=[])
+        monkeypatch.setattr(OutputBuffer, "get_new_lines", get_new_lines)
 
         async def stop_after():
             await asyncio.sleep(0.12)
@@ -218,7 +218,7 @@ class TestIdleTracking:
         # idle_seconds should have accumulated some positive amount
         assert monitor.idle_seconds > 0
 
-    async def test_active_output_cleared_after_threshold(self):
+    async def test_active_output_cleared_after_threshold(self, monkeypatch):
         """active_output should flip False once idle exceeds completion_threshold."""
         cfg = {
             "poll_interval_ms": 10,
@@ -230,7 +230,8 @@ class TestIdleTracking:
         monitor.active_output = True
         monitor.idle_seconds = 0
         # No rolling buffer content, so _check_completion will return early
-        monitor.output_buffer.get_new_lines = MagicMock(return_value=[])
+        get_new_lines = MagicMock(return_value=[])
+        monkeypatch.setattr(OutputBuffer, "get_new_lines", get_new_lines)
         monitor.output_buffer.rolling_buffer = []
 
         async def stop_after():
@@ -258,7 +259,7 @@ class TestProcessOutput:
 
     async def test_triggers_on_event_for_non_none(self):
         """When detector returns a non-'none' type, on_event is called."""
-        callback = AsyncMock()
+        callback = _Recorder()
         monitor = _make_monitor(on_event=callback)
         detection = DetectionResult(type="error", matched_text="Error", pattern="err")
         monitor.detector = MagicMock()
@@ -267,17 +268,17 @@ class TestProcessOutput:
         lines = ["Something failed", "Error: crash"]
         await monitor._process_output(lines)
 
-        callback.assert_awaited_once_with(monitor.session, detection, lines)
+        assert callback.calls == [(monitor.session, detection, lines)]
 
     async def test_does_not_trigger_on_event_for_none(self):
         """When detector returns 'none', on_event should NOT be called."""
-        callback = AsyncMock()
+        callback = _Recorder()
         monitor = _make_monitor(on_event=callback)
         monitor.detector = MagicMock()
         monitor.detector.classify.return_value = DetectionResult(type="none")
 
         await monitor._process_output(["some normal output"])
-        callback.assert_not_awaited()
+        assert callback.calls == []
 
     async def test_no_callback_does_not_crash(self):
         """If on_event is None, _process_output should not raise."""
@@ -291,7 +292,7 @@ class TestProcessOutput:
 
     async def test_sets_last_activity_on_event(self):
         """on_event trigger should update session.last_activity."""
-        callback = AsyncMock()
+        callback = _Recorder()
         monitor = _make_monitor(on_event=callback)
         monitor.session.last_activity = None
         monitor.detector = MagicMock()
@@ -311,7 +312,7 @@ class TestProcessOutput:
 class TestCheckCompletion:
     async def test_triggers_on_completion_detected(self):
         """When rolling buffer contains a completion pattern, fire on_event."""
-        callback = AsyncMock()
+        callback = _Recorder()
         monitor = _make_monitor(on_event=callback)
         completion_result = DetectionResult(
             type="completion", matched_text="all tests passed", pattern=".*"
@@ -325,21 +326,19 @@ class TestCheckCompletion:
 
         await monitor._check_completion()
 
-        callback.assert_awaited_once()
-        args = callback.call_args[0]
-        assert args[0] is monitor.session
-        assert args[1].type == "completion"
+        recent = ["Running tests...", "all 42 tests passed"]
+        assert callback.calls == [(monitor.session, completion_result, recent)]
 
     async def test_no_trigger_for_non_completion(self):
         """If rolling buffer pattern is not 'completion', skip the event."""
-        callback = AsyncMock()
+        callback = _Recorder()
         monitor = _make_monitor(on_event=callback)
         monitor.detector = MagicMock()
         monitor.detector.classify.return_value = DetectionResult(type="error")
         monitor.output_buffer.rolling_buffer = ["Some error output"]
 
         await monitor._check_completion()
-        callback.assert_not_awaited()
+        assert callback.calls == []
 
     async def test_empty_rolling_buffer_returns_early(self):
         """If rolling_buffer is empty, _check_completion returns without calling classify."""
@@ -352,7 +351,7 @@ class TestCheckCompletion:
 
     async def test_uses_last_10_lines(self):
         """_check_completion should only look at the last 10 lines of the buffer."""
-        callback = AsyncMock()
+        callback = _Recorder()
         monitor = _make_monitor(on_event=callback)
         monitor.detector = MagicMock()
         monitor.detector.classify.return_value = DetectionResult(type="none")
@@ -392,9 +391,9 @@ class TestCheckCompletion:
 
 
 class TestStartLoopIntegration:
-    async def test_new_output_triggers_process_and_resets_idle(self):
+    async def test_new_output_triggers_process_and_resets_idle(self, monkeypatch):
         """Full loop: new lines trigger _process_output and reset idle."""
-        callback = AsyncMock()
+        callback = _Recorder()
         cfg = {
             "poll_interval_ms": 10,
             "active_poll_interval_ms": 10,
@@ -406,9 +405,8 @@ class TestStartLoopIntegration:
         monitor.detector = MagicMock()
         monitor.detector.classify.return_value = error_result
         # Return output on first call, then empty
-        monitor.output_buffer.get_new_lines = MagicMock(
-            side_effect=[["Error: failure"], [], []]
-        )
+        get_new_lines = MagicMock(side_effect=[["Error: failure"], [], []])
+        monkeypatch.setattr(OutputBuffer, "get_new_lines", get_new_lines)
 
         async def stop_after():
             await asyncio.sleep(0.06)
@@ -416,10 +414,10 @@ class TestStartLoopIntegration:
 
         await asyncio.gather(monitor.start(), stop_after())
 
-        callback.assert_awaited_once()
+        assert callback.calls == [(monitor.session, error_result, ["Error: failure"])]
         assert monitor.active_output is True or monitor.idle_seconds > 0
 
-    async def test_exception_in_loop_does_not_crash(self):
+    async def test_exception_in_loop_does_not_crash(self, monkeypatch):
         """An exception during polling should be caught and not stop the loop."""
         cfg = {
             "poll_interval_ms": 10,
@@ -437,7 +435,8 @@ class TestStartLoopIntegration:
                 raise RuntimeError("tmux pane gone")
             return []
 
-        monitor.output_buffer.get_new_lines = MagicMock(side_effect=side_effect_fn)
+        get_new_lines = MagicMock(side_effect=side_effect_fn)
+        monkeypatch.setattr(OutputBuffer, "get_new_lines", get_new_lines)
 
         async def stop_after():
             await asyncio.sleep(0.08)
@@ -448,9 +447,9 @@ class TestStartLoopIntegration:
         # Loop should have continued after the exception
         assert call_count >= 2
 
-    async def test_completion_check_fires_after_idle_threshold(self):
+    async def test_completion_check_fires_after_idle_threshold(self, monkeypatch):
         """After active output followed by idle exceeding threshold, _check_completion runs."""
-        callback = AsyncMock()
+        callback = _Recorder()
         cfg = {
             "poll_interval_ms": 10,
             "active_poll_interval_ms": 10,
@@ -463,9 +462,10 @@ class TestStartLoopIntegration:
         monitor.detector.classify.return_value = completion_result
         # First call returns output to set active_output = True,
         # then empty calls to accumulate idle time.
-        monitor.output_buffer.get_new_lines = MagicMock(
+        get_new_lines = MagicMock(
             side_effect=[["task done"], [], [], [], [], [], []]
         )
+        monkeypatch.setattr(OutputBuffer, "get_new_lines", get_new_lines)
         monitor.output_buffer.rolling_buffer = ["task done"]
 
         async def stop_after():
@@ -476,7 +476,7 @@ class TestStartLoopIntegration:
 
         # on_event should have been called at least once from _process_output
         # and possibly again from _check_completion
-        assert callback.await_count >= 1
+        assert len(callback.calls) >= 1
 
 
 # ---------------------------------------------------------------------------
@@ -492,3 +492,14 @@ class TestConfigDefaults:
         assert monitor._poll_active == 0.3
         assert monitor._poll_idle == 2.0
         assert monitor._completion_threshold == 30
+
+    def test_same_config_reuses_cached_intervals(self):
+        """Monitors built from identical config values share one cached tuple."""
+        from conductor.sessions.monitor import _poll_intervals
+
+        _poll_intervals.cache_clear()
+        _make_monitor()
+        _make_monitor()
+        info = _poll_intervals.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
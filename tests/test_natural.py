@@ -2,76 +2,221 @@
 
 from __future__ import annotations
 
-import json
+import copy
+import functools
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import MappingProxyType, SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
 
+import pytest
 
+try:
+    import orjson as _json
+except ImportError:  # optional speedup; stdlib json parses the same output
+    import json as _json
+
+from conductor.bot.handlers import commands as _commands_mod
+from conductor.bot.handlers import fallback as _fallback_mod
+from conductor.bot.handlers import natural as _natural_mod
 from conductor.bot.handlers.natural import (
     handle_natural_language,
     _dispatch_nlp_command,
 )
 
+# All tests here share one session-scoped event loop instead of a new loop
+# per test.
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
 # ── Helpers ──────────────────────────────────────────────────────────────────
 
-# Patch targets: these are imported INSIDE the function body via
-#   from conductor.bot.bot import get_app_data
-#   from conductor.bot.handlers.commands import _session_manager
-# so we patch them at their origin modules.
-_PATCH_APP_DATA = "conductor.bot.bot.get_app_data"
-_PATCH_MGR = "conductor.bot.handlers.commands._session_manager"
+# Patch targets: get_app_data, _session_manager and the slash handlers are
+# imported INSIDE the handler function bodies, so we patch them on their
+# origin modules (resolved once above). Every swap goes through pytest's
+# monkeypatch, which undoes them all in one teardown. conductor.bot.bot is the
+# exception: other test modules evict it from sys.modules, so it is patched by
+# dotted path to hit whichever module object the handler will import.
 
+# Read-only app_data shapes shared by tests; the handler only calls .get().
+_APP_DATA_SESS1 = MappingProxyType({"last_prompt_session": "sess-1", "brain": None})
+_APP_DATA_NO_PROMPT = MappingProxyType({"last_prompt_session": None, "brain": None})
 
-def _make_session(
-    *,
-    id: str = "sess-1",
-    number: int = 1,
-    alias: str = "claude",
-    type: str = "claude-code",
-    working_dir: str = "/tmp",
-    tmux_session: str = "tmux-1",
-    status: str = "running",
-    color_emoji: str = "🔵",
-) -> MagicMock:
-    """Create a mock Session with all required fields."""
+# Session timestamps are never asserted on, so one fixed value serves all.
+_FIXED_TS = datetime(2024, 1, 1).isoformat()
+
+
+# Prototype mocks are built once; the _make_* helpers return shallow copies.
+# Attributes a copy does not reassign are shared by reference across every
+# copy and must not be mutated by tests.
+_MANAGER_PROTOTYPE = MagicMock()
+
+
+@functools.cache
+def _make_session_base() -> MagicMock:
+    """Build the prototype session mock, populated with default fields."""
     s = MagicMock()
-    s.id = id
-    s.number = number
-    s.alias = alias
-    s.type = type
-    s.working_dir = working_dir
-    s.tmux_session = tmux_session
-    s.status = status
-    s.color_emoji = color_emoji
+    s.id = "sess-1"
+    s.number = 1
+    s.alias = "claude"
+    s.type = "claude-code"
+    s.working_dir = "/tmp"
+    s.tmux_session = "tmux-1"
+    s.status = "running"
+    s.color_emoji = "🔵"
     s.token_used = 0
     s.token_limit = 45
     s.last_activity = None
     s.last_summary = None
-    s.created_at = datetime.now().isoformat()
-    s.updated_at = datetime.now().isoformat()
+    s.created_at = _FIXED_TS
+    s.updated_at = _FIXED_TS
+    return s
+
+
+def _make_session(**overrides) -> MagicMock:
+    """Create a mock Session: the cached defaults plus any overridden fields."""
+    s = copy.copy(_make_session_base())
+    for name, value in overrides.items():
+        setattr(s, name, value)
     return s
 
 
-def _make_message(text: str = "hello") -> AsyncMock:
-    """Create a mock aiogram Message."""
-    msg = AsyncMock()
-    msg.text = text
-    msg.answer = AsyncMock()
-    msg.from_user = MagicMock()
-    msg.from_user.id = 12345
-    return msg
+class _AsyncCall:
+    """Awaitable stand-in for ``Message.answer`` that records each call."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[tuple, dict]] = []
 
+    async def __call__(self, *args, **kwargs) -> None:
+        self.calls.append((args, kwargs))
 
-def _make_manager(sessions: list | None = None) -> MagicMock:
-    """Create a mock SessionManager."""
-    mgr = MagicMock()
-    mgr.list_sessions = AsyncMock(return_value=sessions or [])
-    mgr.get_session = MagicMock(return_value=None)
+    def assert_called_once(self) -> None:
+        assert len(self.calls) == 1, f"Expected 1 call, got {len(self.calls)}"
+
+    def assert_not_called(self) -> None:
+        assert not self.calls, f"Expected no calls, got {len(self.calls)}"
+
+
+def _make_message(text: str = "hello") -> SimpleNamespace:
+    """Create a stand-in aiogram Message."""
+    return SimpleNamespace(
+        text=text, answer=_AsyncCall(), from_user=SimpleNamespace(id=12345)
+    )
+
+
+def _async_return(value):
+    """Build a plain coroutine function returning ``value`` (no call tracking)."""
+
+    async def _f(*args, **kwargs):
+        return value
+
+    return _f
+
+
+def _return_none(*args, **kwargs) -> None:
+    """Default lookup stub: no session found."""
+    return None
+
+
+def _make_manager(
+    sessions: list | None = None,
+    *,
+    get_session=None,
+    resolve_session=None,
+) -> MagicMock:
+    """Create a mock SessionManager.
+
+    ``get_session`` / ``resolve_session`` default to a plain stub returning
+    None; pass a ``MagicMock`` when a test needs a result or call assertions.
+    """
+    mgr = copy.copy(_MANAGER_PROTOTYPE)
+    mgr.list_sessions = _async_return(sessions or [])
+    mgr.get_session = _return_none if get_session is None else get_session
     mgr.send_input = MagicMock()
-    mgr.resolve_session = MagicMock(return_value=None)
+    mgr.resolve_session = (
+        _return_none if resolve_session is None else resolve_session
+    )
     return mgr
 
 
+@dataclass
+class FakeMgr:
+    """Minimal SessionManager for tests that only list sessions and send input."""
+
+    sessions: list = field(default_factory=list)
+    send_calls: list = field(default_factory=list)
+
+    async def list_sessions(self) -> list:
+        return self.sessions
+
+    def send_input(self, session_id: str, text: str) -> bool:
+        self.send_calls.append((session_id, text))
+        return True
+
+    def get_session(self, session_id: str) -> None:
+        return None
+
+    def resolve_session(self, ref: str) -> None:
+        return None
+
+
+@pytest.fixture
+def patched_env(monkeypatch):
+    """Return a helper that swaps in app data and the session manager.
+
+    Uses plain ``monkeypatch.setattr`` swaps, restored when the test finishes.
+    """
+
+    def _apply(app_data: Mapping[str, Any], mgr) -> None:
+        monkeypatch.setattr("conductor.bot.bot.get_app_data", lambda: app_data)
+        monkeypatch.setattr(_commands_mod, "_session_manager", mgr)
+
+    return _apply
+
+
+@pytest.fixture(scope="class")
+def _class_mgr_and_msg():
+    """Build one manager/message pair per test class."""
+    mgr = _make_manager(get_session=MagicMock(return_value=None))
+    return mgr, _make_message()
+
+
+@pytest.fixture
+def mgr_and_msg(_class_mgr_and_msg):
+    """Class-shared ``(mgr, msg)`` pair, reset after every test.
+
+    Tests set ``msg.text`` and ``mgr.get_session.return_value`` themselves.
+    """
+    mgr, msg = _class_mgr_and_msg
+    yield mgr, msg
+    mgr.get_session.reset_mock()
+    mgr.get_session.return_value = None
+    mgr.send_input.reset_mock()
+    msg.answer.calls.clear()
+
+
+_DISPATCH_TARGETS = (
+    "cmd_status",
+    "cmd_help",
+    "cmd_tokens",
+    "cmd_kill",
+    "cmd_pause",
+    "cmd_resume",
+    "cmd_output",
+    "cmd_digest",
+)
+
+
+@pytest.fixture
+def cmd_mocks(monkeypatch):
+    """Replace every NLP-dispatchable slash handler with a call recorder."""
+    stubs = {name: _AsyncCall() for name in _DISPATCH_TARGETS}
+    for name, stub in stubs.items():
+        monkeypatch.setattr(_commands_mod, name, stub)
+    return stubs
+
+
 # ── Tests: early returns ─────────────────────────────────────────────────────
 
 
@@ -116,15 +261,14 @@ class TestEarlyReturns:
 class TestNoManager:
     """When _session_manager is None the bot is still initializing."""
 
-    async def test_no_manager_sends_initializing_message(self):
+    async def test_no_manager_sends_initializing_message(self, patched_env):
         """With no manager, user gets an initializing message."""
         msg = _make_message("check session 1")
-        with patch(_PATCH_APP_DATA, return_value={}):
-            with patch(_PATCH_MGR, None):
-                await handle_natural_language(msg)
+        patched_env({}, None)
+        await handle_natural_language(msg)
 
         msg.answer.assert_called_once()
-        call_text = msg.answer.call_args[0][0]
+        call_text = msg.answer.calls[-1][0][0]
         assert "initializing" in call_text.lower()
 
 
@@ -134,37 +278,33 @@ class TestNoManager:
 class TestShortMessageWaiting:
     """Short messages (<=10 chars) with a last_prompt_session that is waiting."""
 
-    async def test_short_message_sent_to_waiting_session(self):
+    async def test_short_message_sent_to_waiting_session(
+        self, patched_env, mgr_and_msg
+    ):
         """A short 'yes' to a waiting session should send input."""
         session = _make_session(id="sess-1", status="waiting", alias="builder")
-        mgr = _make_manager()
+        mgr, msg = mgr_and_msg
         mgr.get_session.return_value = session
 
-        app_data = {"last_prompt_session": "sess-1", "brain": None}
-
-        msg = _make_message("yes")
-        with patch(_PATCH_APP_DATA, return_value=app_data):
-            with patch(_PATCH_MGR, mgr):
-                await handle_natural_language(msg)
+        msg.text = "yes"
+        patched_env(_APP_DATA_SESS1, mgr)
+        await handle_natural_language(msg)
 
         mgr.send_input.assert_called_once_with("sess-1", "yes")
         msg.answer.assert_called_once()
-        call_text = msg.answer.call_args[0][0]
+        call_text = msg.answer.calls[-1][0][0]
         assert "Sent to" in call_text
         assert "builder" in call_text
 
-    async def test_short_numeric_input_sent(self):
+    async def test_short_numeric_input_sent(self, patched_env, mgr_and_msg):
         """A short numeric response like '2' should be sent to waiting session."""
         session = _make_session(id="sess-2", status="waiting", alias="setup")
-        mgr = _make_manager()
+        mgr, msg = mgr_and_msg
         mgr.get_session.return_value = session
 
-        app_data = {"last_prompt_session": "sess-2", "brain": None}
-
-        msg = _make_message("2")
-        with patch(_PATCH_APP_DATA, return_value=app_data):
-            with patch(_PATCH_MGR, mgr):
-                await handle_natural_language(msg)
+        msg.text = "2"
+        patched_env({**_APP_DATA_SESS1, "last_prompt_session": "sess-2"}, mgr)
+        await handle_natural_language(msg)
 
         mgr.send_input.assert_called_once_with("sess-2", "2")
 
@@ -175,59 +315,23 @@ class TestShortMessageWaiting:
 class TestDestructiveKeywordBlocking:
     """B4 fix: short messages with destructive keywords are blocked."""
 
-    async def test_delete_blocked_for_waiting_session(self):
-        """'delete' as a short response should be blocked with warning."""
+    @pytest.mark.parametrize("keyword", ["delete", "remove", "reset"])
+    async def test_destructive_keyword_blocked(self, patched_env, mgr_and_msg, keyword):
+        """A destructive short response should be blocked with a warning."""
         session = _make_session(id="sess-1", status="waiting")
-        mgr = _make_manager()
+        mgr, msg = mgr_and_msg
         mgr.get_session.return_value = session
 
-        app_data = {"last_prompt_session": "sess-1", "brain": None}
-
-        msg = _make_message("delete")
-        with patch(_PATCH_APP_DATA, return_value=app_data):
-            with patch(_PATCH_MGR, mgr):
-                await handle_natural_language(msg)
+        msg.text = keyword
+        patched_env(_APP_DATA_SESS1, mgr)
+        await handle_natural_language(msg)
 
         mgr.send_input.assert_not_called()
         msg.answer.assert_called_once()
-        call_text = msg.answer.call_args[0][0]
+        call_text = msg.answer.calls[-1][0][0]
         assert "destructive" in call_text.lower()
         assert "Blocked" in call_text
 
-    async def test_remove_blocked_for_waiting_session(self):
-        """'remove' should also be blocked."""
-        session = _make_session(id="sess-1", status="waiting")
-        mgr = _make_manager()
-        mgr.get_session.return_value = session
-
-        app_data = {"last_prompt_session": "sess-1", "brain": None}
-
-        msg = _make_message("remove")
-        with patch(_PATCH_APP_DATA, return_value=app_data):
-            with patch(_PATCH_MGR, mgr):
-                await handle_natural_language(msg)
-
-        mgr.send_input.assert_not_called()
-        call_text = msg.answer.call_args[0][0]
-        assert "destructive" in call_text.lower()
-
-    async def test_reset_blocked_for_waiting_session(self):
-        """'reset' should also be blocked."""
-        session = _make_session(id="sess-1", status="waiting")
-        mgr = _make_manager()
-        mgr.get_session.return_value = session
-
-        app_data = {"last_prompt_session": "sess-1", "brain": None}
-
-        msg = _make_message("reset")
-        with patch(_PATCH_APP_DATA, return_value=app_data):
-            with patch(_PATCH_MGR, mgr):
-                await handle_natural_language(msg)
-
-        mgr.send_input.assert_not_called()
-        call_text = msg.answer.call_args[0][0]
-        assert "Blocked" in call_text
-
 
 # ── Tests: B4 fix — short message to non-waiting session falls through ───────
 
@@ -235,34 +339,31 @@ class TestDestructiveKeywordBlocking:
 class TestShortMessageNonWaiting:
     """B4 fix: short messages when session is not waiting should fall through."""
 
-    async def test_short_msg_non_waiting_session_falls_through(self):
+    async def test_short_msg_non_waiting_session_falls_through(self, patched_env):
         """Short message to a 'running' session should not send input via short path."""
         session = _make_session(id="sess-1", status="running")
-        mgr = _make_manager(sessions=[session])
-        mgr.get_session.return_value = session
-
-        app_data = {"last_prompt_session": "sess-1", "brain": None}
+        mgr = _make_manager(
+            sessions=[session], get_session=MagicMock(return_value=session)
+        )
 
         msg = _make_message("yes")
-        with patch(_PATCH_APP_DATA, return_value=app_data):
-            with patch(_PATCH_MGR, mgr):
-                await handle_natural_language(msg)
+        patched_env(_APP_DATA_SESS1, mgr)
+        await handle_natural_language(msg)
 
         # Should fall through to single-session fallback, not the short-message path
         # It still sends input, but via the single-session fallback (len(sessions)==1)
         mgr.send_input.assert_called_once_with("sess-1", "yes")
 
-    async def test_short_msg_no_session_found_falls_through(self):
+    async def test_short_msg_no_session_found_falls_through(
+        self, patched_env, mgr_and_msg
+    ):
         """Short message when get_session returns None should fall through."""
-        mgr = _make_manager(sessions=[])
+        mgr, msg = mgr_and_msg
         mgr.get_session.return_value = None
 
-        app_data = {"last_prompt_session": "sess-1", "brain": None}
-
-        msg = _make_message("y")
-        with patch(_PATCH_APP_DATA, return_value=app_data):
-            with patch(_PATCH_MGR, mgr):
-                await handle_natural_language(msg)
+        msg.text = "y"
+        patched_env(_APP_DATA_SESS1, mgr)
+        await handle_natural_language(msg)
 
         # No sessions, should reach the fallback path
         mgr.send_input.assert_not_called()
@@ -270,102 +371,54 @@ class TestShortMessageNonWaiting:
         msg.answer.assert_called_once()
 
 
-# ── Tests: NLP dispatch — high confidence ────────────────────────────────────
-
-
-class TestNlpDispatchHighConfidence:
-    """NLP brain returns high confidence -- routes to the correct handler."""
-
-    async def test_nlp_status_command_dispatched(self):
-        """High-confidence 'status' command from brain should dispatch."""
-        session = _make_session()
-        mgr = _make_manager(sessions=[session])
-
-        brain = AsyncMock()
-        brain.parse_nlp = AsyncMock(
-            return_value={
-                "confidence": 0.95,
-                "command": "status",
-                "session": None,
-                "args": {},
-            }
-        )
-
-        app_data = {
-            "brain": brain,
-            "last_prompt_session": None,
-            "last_prompt_context": None,
-        }
-
-        msg = _make_message("show me the status")
-        with patch(_PATCH_APP_DATA, return_value=app_data):
-            with patch(_PATCH_MGR, mgr):
-                with patch(
-                    "conductor.bot.handlers.natural._dispatch_nlp_command",
-                    new_callable=AsyncMock,
-                ) as mock_dispatch:
-                    await handle_natural_language(msg)
-
-        mock_dispatch.assert_called_once()
-        result_arg = mock_dispatch.call_args[0][1]
-        assert result_arg["command"] == "status"
-
-    async def test_nlp_input_command_dispatched(self):
-        """High-confidence 'input' command should dispatch with session ref."""
-        session = _make_session()
-        mgr = _make_manager(sessions=[session])
-
-        brain = AsyncMock()
-        brain.parse_nlp = AsyncMock(
-            return_value={
-                "confidence": 0.9,
-                "command": "input",
-                "session": "1",
-                "args": {"text": "npm install"},
-            }
-        )
-
-        app_data = {
-            "brain": brain,
-            "last_prompt_session": None,
-            "last_prompt_context": None,
-        }
-
-        msg = _make_message("send npm install to session 1")
-        with patch(_PATCH_APP_DATA, return_value=app_data):
-            with patch(_PATCH_MGR, mgr):
-                with patch(
-                    "conductor.bot.handlers.natural._dispatch_nlp_command",
-                    new_callable=AsyncMock,
-                ) as mock_dispatch:
-                    await handle_natural_language(msg)
-
-        mock_dispatch.assert_called_once()
-        result_arg = mock_dispatch.call_args[0][1]
-        assert result_arg["command"] == "input"
-        assert result_arg["args"]["text"] == "npm install"
-
-
-# ── Tests: NLP dispatch — low confidence falls through ───────────────────────
-
-
-class TestNlpDispatchLowConfidence:
-    """NLP brain returns low confidence -- should NOT dispatch, falls through."""
-
-    async def test_low_confidence_falls_through_to_single_session(self):
-        """Confidence < 0.8 should not dispatch; falls to single-session fallback."""
+# ── Tests: NLP dispatch — confidence threshold ───────────────────────────────
+
+
+@pytest.fixture(scope="module")
+def brain():
+    """One brain mock shared by the NLP tests; each test sets its own parse_nlp."""
+    return AsyncMock()
+
+
+_NLP_DISPATCH_CASES = [
+    # High confidence routes to the matching handler
+    (
+        {"confidence": 0.95, "command": "status", "session": None, "args": {}},
+        True,
+    ),
+    (
+        {
+            "confidence": 0.9,
+            "command": "input",
+            "session": "1",
+            "args": {"text": "npm install"},
+        },
+        True,
+    ),
+    # Confidence < 0.8 falls through to the single-session fallback
+    (
+        {"confidence": 0.5, "command": "status", "session": None, "args": {}},
+        False,
+    ),
+    # 'unknown' never dispatches, even with high confidence
+    (
+        {"confidence": 0.95, "command": "unknown", "session": None, "args": {}},
+        False,
+    ),
+]
+
+
+class TestNlpDispatchConfidence:
+    """Only high-confidence, known commands from the brain are dispatched."""
+
+    @pytest.mark.parametrize("parse_result, should_dispatch", _NLP_DISPATCH_CASES)
+    async def test_nlp_dispatch(
+        self, monkeypatch, patched_env, brain, parse_result, should_dispatch
+    ):
+        """Dispatch happens iff confidence >= 0.8 and command is not 'unknown'."""
         session = _make_session(id="sess-1", alias="builder")
-        mgr = _make_manager(sessions=[session])
-
-        brain = AsyncMock()
-        brain.parse_nlp = AsyncMock(
-            return_value={
-                "confidence": 0.5,
-                "command": "status",
-                "session": None,
-                "args": {},
-            }
-        )
+        mgr = FakeMgr(sessions=[session])
+        brain.parse_nlp = _async_return(parse_result)
 
         app_data = {
             "brain": brain,
@@ -373,47 +426,31 @@ class TestNlpDispatchLowConfidence:
             "last_prompt_context": None,
         }
 
-        msg = _make_message("maybe check something")
-        with patch(_PATCH_APP_DATA, return_value=app_data):
-            with patch(_PATCH_MGR, mgr):
-                await handle_natural_language(msg)
+        msg = _make_message("do something with the sessions")
+        patched_env(app_data, mgr)
+        mock_dispatch = AsyncMock()
+        monkeypatch.setattr(_natural_mod, "_dispatch_nlp_command", mock_dispatch)
+        await handle_natural_language(msg)
 
-        # Should have fallen through to single-session send
-        mgr.send_input.assert_called_once_with("sess-1", "maybe check something")
+        if should_dispatch:
+            mock_dispatch.assert_called_once()
+            assert mock_dispatch.call_args[0][1] == parse_result
+            assert mgr.send_calls == []
+        else:
+            mock_dispatch.assert_not_called()
+            assert mgr.send_calls == [("sess-1", "do something with the sessions")]
 
-    async def test_unknown_command_falls_through(self):
-        """Command 'unknown' even with high confidence should fall through."""
-        session = _make_session(id="sess-1")
-        mgr = _make_manager(sessions=[session])
 
-        brain = AsyncMock()
-        brain.parse_nlp = AsyncMock(
-            return_value={
-                "confidence": 0.95,
-                "command": "unknown",
-                "session": None,
-                "args": {},
-            }
-        )
+# ── Tests: NLP dispatch — failures fall through ──────────────────────────────
 
-        app_data = {
-            "brain": brain,
-            "last_prompt_session": None,
-            "last_prompt_context": None,
-        }
 
-        msg = _make_message("do something weird")
-        with patch(_PATCH_APP_DATA, return_value=app_data):
-            with patch(_PATCH_MGR, mgr):
-                await handle_natural_language(msg)
+class TestNlpParseFailure:
+    """NLP brain raises -- should NOT dispatch, falls through."""
 
-        # 'unknown' at any confidence should not dispatch
-        mgr.send_input.assert_called_once_with("sess-1", "do something weird")
-
-    async def test_nlp_parse_exception_falls_through(self):
+    async def test_nlp_parse_exception_falls_through(self, patched_env):
         """If brain.parse_nlp raises, should fall through gracefully."""
         session = _make_session(id="sess-1")
-        mgr = _make_manager(sessions=[session])
+        mgr = FakeMgr(sessions=[session])
 
         brain = AsyncMock()
         brain.parse_nlp = AsyncMock(side_effect=RuntimeError("API timeout"))
@@ -425,12 +462,11 @@ class TestNlpDispatchLowConfidence:
         }
 
         msg = _make_message("check status")
-        with patch(_PATCH_APP_DATA, return_value=app_data):
-            with patch(_PATCH_MGR, mgr):
-                await handle_natural_language(msg)
+        patched_env(app_data, mgr)
+        await handle_natural_language(msg)
 
         # Exception caught, falls through to single-session
-        mgr.send_input.assert_called_once_with("sess-1", "check status")
+        assert mgr.send_calls == [("sess-1", "check status")]
 
 
 # ── Tests: single session fallback ───────────────────────────────────────────
@@ -439,37 +475,31 @@ class TestNlpDispatchLowConfidence:
 class TestSingleSessionFallback:
     """When there is exactly one session and no NLP match, send input to it."""
 
-    async def test_single_session_receives_input(self):
+    async def test_single_session_receives_input(self, patched_env):
         """With one session and no brain, text goes to that session."""
         session = _make_session(id="sess-only", alias="main")
-        mgr = _make_manager(sessions=[session])
-
-        app_data = {"brain": None, "last_prompt_session": None}
+        mgr = FakeMgr(sessions=[session])
 
         msg = _make_message("run the tests")
-        with patch(_PATCH_APP_DATA, return_value=app_data):
-            with patch(_PATCH_MGR, mgr):
-                await handle_natural_language(msg)
+        patched_env(_APP_DATA_NO_PROMPT, mgr)
+        await handle_natural_language(msg)
 
-        mgr.send_input.assert_called_once_with("sess-only", "run the tests")
+        assert mgr.send_calls == [("sess-only", "run the tests")]
         msg.answer.assert_called_once()
-        call_text = msg.answer.call_args[0][0]
+        call_text = msg.answer.calls[-1][0][0]
         assert "Sent to" in call_text
         assert "main" in call_text
 
-    async def test_single_session_html_mode(self):
+    async def test_single_session_html_mode(self, patched_env):
         """Response should use HTML parse_mode."""
         session = _make_session(id="sess-1")
-        mgr = _make_manager(sessions=[session])
-
-        app_data = {"brain": None, "last_prompt_session": None}
+        mgr = FakeMgr(sessions=[session])
 
         msg = _make_message("hello")
-        with patch(_PATCH_APP_DATA, return_value=app_data):
-            with patch(_PATCH_MGR, mgr):
-                await handle_natural_language(msg)
+        patched_env(_APP_DATA_NO_PROMPT, mgr)
+        await handle_natural_language(msg)
 
-        _, kwargs = msg.answer.call_args
+        _, kwargs = msg.answer.calls[-1]
         assert kwargs.get("parse_mode") == "HTML"
 
 
@@ -479,36 +509,30 @@ class TestSingleSessionFallback:
 class TestNoSessions:
     """When there are zero sessions, send the fallback message."""
 
-    async def test_no_sessions_sends_fallback(self):
+    async def test_no_sessions_sends_fallback(self, patched_env):
         """With no sessions and no brain, fallback handler is called."""
-        mgr = _make_manager(sessions=[])
-
-        app_data = {"brain": None, "last_prompt_session": None}
+        mgr = FakeMgr(sessions=[])
 
         msg = _make_message("hello there")
-        with patch(_PATCH_APP_DATA, return_value=app_data):
-            with patch(_PATCH_MGR, mgr):
-                await handle_natural_language(msg)
+        patched_env(_APP_DATA_NO_PROMPT, mgr)
+        await handle_natural_language(msg)
 
         msg.answer.assert_called_once()
-        call_text = msg.answer.call_args[0][0]
+        call_text = msg.answer.calls[-1][0][0]
         assert "didn't understand" in call_text.lower() or "help" in call_text.lower()
 
-    async def test_multiple_sessions_no_brain_sends_fallback(self):
+    async def test_multiple_sessions_no_brain_sends_fallback(self, patched_env):
         """With 2+ sessions and no brain, should send fallback (ambiguous)."""
         s1 = _make_session(id="s1", number=1, alias="first")
         s2 = _make_session(id="s2", number=2, alias="second")
-        mgr = _make_manager(sessions=[s1, s2])
-
-        app_data = {"brain": None, "last_prompt_session": None}
+        mgr = FakeMgr(sessions=[s1, s2])
 
         msg = _make_message("do something")
-        with patch(_PATCH_APP_DATA, return_value=app_data):
-            with patch(_PATCH_MGR, mgr):
-                await handle_natural_language(msg)
+        patched_env(_APP_DATA_NO_PROMPT, mgr)
+        await handle_natural_language(msg)
 
         # Should NOT send input (ambiguous), should fallback
-        mgr.send_input.assert_not_called()
+        assert mgr.send_calls == []
         msg.answer.assert_called_once()
 
 
@@ -521,8 +545,7 @@ class TestDispatchNlpCommand:
     async def test_dispatch_input_sends_to_session(self):
         """'input' command should resolve session and send text."""
         session = _make_session(id="sess-1", alias="worker")
-        mgr = _make_manager()
-        mgr.resolve_session.return_value = session
+        mgr = _make_manager(resolve_session=MagicMock(return_value=session))
 
         result = {"command": "input", "session": "1", "args": {"text": "npm test"}}
         msg = _make_message()
@@ -531,7 +554,7 @@ class TestDispatchNlpCommand:
         mgr.resolve_session.assert_called_once_with("1")
         mgr.send_input.assert_called_once_with("sess-1", "npm test")
         msg.answer.assert_called_once()
-        call_text = msg.answer.call_args[0][0]
+        call_text = msg.answer.calls[-1][0][0]
         assert "npm test" in call_text
 
     async def test_dispatch_input_no_session_ref_no_send(self):
@@ -545,148 +568,53 @@ class TestDispatchNlpCommand:
     async def test_dispatch_input_no_text_no_send(self):
         """'input' with no text should not send."""
         session = _make_session()
-        mgr = _make_manager()
-        mgr.resolve_session.return_value = session
+        mgr = _make_manager(resolve_session=MagicMock(return_value=session))
         result = {"command": "input", "session": "1", "args": {}}
         msg = _make_message()
         await _dispatch_nlp_command(msg, result, mgr)
         mgr.send_input.assert_not_called()
 
-    async def test_dispatch_status_calls_cmd_status(self):
-        """'status' command should call cmd_status."""
+    @pytest.mark.parametrize(
+        "command, session_ref, target, expected_text",
+        [
+            ("status", None, "cmd_status", None),
+            ("status", "2", "cmd_status", "/status 2"),
+            ("help", None, "cmd_help", None),
+            ("tokens", None, "cmd_tokens", None),
+            ("kill", "3", "cmd_kill", "/kill 3"),
+            ("pause", "1", "cmd_pause", "/pause 1"),
+            ("resume", "2", "cmd_resume", "/resume 2"),
+            ("output", "1", "cmd_output", "/output 1"),
+            ("digest", None, "cmd_digest", None),
+        ],
+    )
+    async def test_dispatch_routes(
+        self, cmd_mocks, command, session_ref, target, expected_text
+    ):
+        """Each command calls its handler; a session ref rewrites message.text."""
         mgr = _make_manager()
-        result = {"command": "status", "session": None, "args": {}}
+        result = {"command": command, "session": session_ref, "args": {}}
         msg = _make_message()
-        with patch(
-            "conductor.bot.handlers.commands.cmd_status",
-            new_callable=AsyncMock,
-        ) as mock_cmd:
-            await _dispatch_nlp_command(msg, result, mgr)
-        mock_cmd.assert_called_once_with(msg)
-
-    async def test_dispatch_status_with_session_sets_text(self):
-        """'status' with session ref should modify message.text."""
-        mgr = _make_manager()
-        result = {"command": "status", "session": "2", "args": {}}
-        msg = _make_message()
-        with patch(
-            "conductor.bot.handlers.commands.cmd_status",
-            new_callable=AsyncMock,
-        ) as mock_cmd:
-            await _dispatch_nlp_command(msg, result, mgr)
-        assert msg.text == "/status 2"
-        mock_cmd.assert_called_once()
-
-    async def test_dispatch_help_calls_cmd_help(self):
-        """'help' command should call cmd_help."""
-        mgr = _make_manager()
-        result = {"command": "help", "session": None, "args": {}}
-        msg = _make_message()
-        with patch(
-            "conductor.bot.handlers.commands.cmd_help",
-            new_callable=AsyncMock,
-        ) as mock_cmd:
-            await _dispatch_nlp_command(msg, result, mgr)
-        mock_cmd.assert_called_once()
-
-    async def test_dispatch_tokens_calls_cmd_tokens(self):
-        """'tokens' command should call cmd_tokens."""
-        mgr = _make_manager()
-        result = {"command": "tokens", "session": None, "args": {}}
-        msg = _make_message()
-        with patch(
-            "conductor.bot.handlers.commands.cmd_tokens",
-            new_callable=AsyncMock,
-        ) as mock_cmd:
-            await _dispatch_nlp_command(msg, result, mgr)
-        mock_cmd.assert_called_once()
-
-    async def test_dispatch_kill_with_session(self):
-        """'kill' command with session ref should call cmd_kill."""
-        mgr = _make_manager()
-        result = {"command": "kill", "session": "3", "args": {}}
-        msg = _make_message()
-        with patch(
-            "conductor.bot.handlers.commands.cmd_kill",
-            new_callable=AsyncMock,
-        ) as mock_cmd:
-            await _dispatch_nlp_command(msg, result, mgr)
-        assert msg.text == "/kill 3"
-        mock_cmd.assert_called_once()
-
-    async def test_dispatch_kill_without_session_no_call(self):
+        await _dispatch_nlp_command(msg, result, mgr)
+        assert cmd_mocks[target].calls == [((msg,), {})]
+        assert msg.text == (expected_text or "hello")
+
+    async def test_dispatch_kill_without_session_no_call(self, cmd_mocks):
         """'kill' command without session ref should not call cmd_kill."""
         mgr = _make_manager()
         result = {"command": "kill", "session": None, "args": {}}
         msg = _make_message()
-        with patch(
-            "conductor.bot.handlers.commands.cmd_kill",
-            new_callable=AsyncMock,
-        ) as mock_cmd:
-            await _dispatch_nlp_command(msg, result, mgr)
-        mock_cmd.assert_not_called()
-
-    async def test_dispatch_pause_with_session(self):
-        """'pause' command with session ref should call cmd_pause."""
-        mgr = _make_manager()
-        result = {"command": "pause", "session": "1", "args": {}}
-        msg = _make_message()
-        with patch(
-            "conductor.bot.handlers.commands.cmd_pause",
-            new_callable=AsyncMock,
-        ) as mock_cmd:
-            await _dispatch_nlp_command(msg, result, mgr)
-        assert msg.text == "/pause 1"
-        mock_cmd.assert_called_once()
-
-    async def test_dispatch_resume_with_session(self):
-        """'resume' command with session ref should call cmd_resume."""
-        mgr = _make_manager()
-        result = {"command": "resume", "session": "2", "args": {}}
-        msg = _make_message()
-        with patch(
-            "conductor.bot.handlers.commands.cmd_resume",
-            new_callable=AsyncMock,
-        ) as mock_cmd:
-            await _dispatch_nlp_command(msg, result, mgr)
-        assert msg.text == "/resume 2"
-        mock_cmd.assert_called_once()
-
-    async def test_dispatch_output_with_session(self):
-        """'output' command with session ref should call cmd_output."""
-        mgr = _make_manager()
-        result = {"command": "output", "session": "1", "args": {}}
-        msg = _make_message()
-        with patch(
-            "conductor.bot.handlers.commands.cmd_output",
-            new_callable=AsyncMock,
-        ) as mock_cmd:
-            await _dispatch_nlp_command(msg, result, mgr)
-        assert msg.text == "/output 1"
-        mock_cmd.assert_called_once()
-
-    async def test_dispatch_digest_calls_cmd_digest(self):
-        """'digest' command should call cmd_digest."""
-        mgr = _make_manager()
-        result = {"command": "digest", "session": None, "args": {}}
-        msg = _make_message()
-        with patch(
-            "conductor.bot.handlers.commands.cmd_digest",
-            new_callable=AsyncMock,
-        ) as mock_cmd:
-            await _dispatch_nlp_command(msg, result, mgr)
-        mock_cmd.assert_called_once()
-
-    async def test_dispatch_unknown_command_sends_fallback(self):
+        await _dispatch_nlp_command(msg, result, mgr)
+        cmd_mocks["cmd_kill"].assert_not_called()
+
+    async def test_dispatch_unknown_command_sends_fallback(self, monkeypatch):
         """Unrecognized command string should call send_fallback."""
         mgr = _make_manager()
         result = {"command": "nonexistent_cmd", "session": None, "args": {}}
         msg = _make_message()
-        with patch(
-            "conductor.bot.handlers.fallback.send_fallback",
-            new_callable=AsyncMock,
-        ) as mock_fallback:
-            await _dispatch_nlp_command(msg, result, mgr)
+        mock_fallback = AsyncMock()
+        monkeypatch.setattr(_fallback_mod, "send_fallback", mock_fallback)
+        await _dispatch_nlp_command(msg, result, mgr)
         mock_fallback.assert_called_once_with(msg)
 
 
@@ -696,69 +624,61 @@ class TestDispatchNlpCommand:
 class TestEdgeCases:
     """Miscellaneous edge cases."""
 
-    async def test_message_exactly_10_chars_is_short(self):
+    async def test_message_exactly_10_chars_is_short(self, patched_env, mgr_and_msg):
         """A message of exactly 10 characters should be treated as short."""
         session = _make_session(id="sess-1", status="waiting")
-        mgr = _make_manager()
+        mgr, msg = mgr_and_msg
         mgr.get_session.return_value = session
 
         text_10 = "0123456789"  # exactly 10 chars
         assert len(text_10) == 10
 
-        app_data = {"last_prompt_session": "sess-1", "brain": None}
-
-        msg = _make_message(text_10)
-        with patch(_PATCH_APP_DATA, return_value=app_data):
-            with patch(_PATCH_MGR, mgr):
-                await handle_natural_language(msg)
+        msg.text = text_10
+        patched_env(_APP_DATA_SESS1, mgr)
+        await handle_natural_language(msg)
 
         mgr.send_input.assert_called_once_with("sess-1", text_10)
 
-    async def test_message_11_chars_not_short(self):
+    async def test_message_11_chars_not_short(self, patched_env):
         """A message of 11 characters should NOT take the short-message path."""
         session = _make_session(id="sess-1", status="waiting")
-        mgr = _make_manager(sessions=[session])
-        mgr.get_session.return_value = session
+        mgr = _make_manager(
+            sessions=[session], get_session=MagicMock(return_value=session)
+        )
 
         text_11 = "01234567890"  # 11 chars
         assert len(text_11) == 11
 
-        app_data = {"last_prompt_session": "sess-1", "brain": None}
-
         msg = _make_message(text_11)
-        with patch(_PATCH_APP_DATA, return_value=app_data):
-            with patch(_PATCH_MGR, mgr):
-                await handle_natural_language(msg)
+        patched_env(_APP_DATA_SESS1, mgr)
+        await handle_natural_language(msg)
 
         # Should NOT go through short-message path, falls to single-session fallback
         mgr.send_input.assert_called_once_with("sess-1", text_11)
         # The key distinction: get_session was called but the short path was not used
         # This test verifies len(text) <= 10 boundary
 
-    async def test_no_last_prompt_session_skips_short_path(self):
+    async def test_no_last_prompt_session_skips_short_path(self, patched_env):
         """Without last_prompt_session, short messages skip the short-message path."""
         session = _make_session(id="sess-1")
-        mgr = _make_manager(sessions=[session])
-
-        app_data = {"last_prompt_session": None, "brain": None}
+        mgr = _make_manager(sessions=[session], get_session=MagicMock())
 
         msg = _make_message("y")
-        with patch(_PATCH_APP_DATA, return_value=app_data):
-            with patch(_PATCH_MGR, mgr):
-                await handle_natural_language(msg)
+        patched_env(_APP_DATA_NO_PROMPT, mgr)
+        await handle_natural_language(msg)
 
         # Goes through single-session fallback, not short-message path
         mgr.get_session.assert_not_called()
         mgr.send_input.assert_called_once_with("sess-1", "y")
 
-    async def test_brain_result_missing_fields_handled(self):
+    async def test_brain_result_missing_fields_handled(self, patched_env):
         """Brain returning partial result (missing keys) should not crash."""
         session = _make_session(id="sess-1")
         mgr = _make_manager(sessions=[session])
 
         brain = AsyncMock()
         # Return result with missing 'confidence' and 'command' keys
-        brain.parse_nlp = AsyncMock(return_value={})
+        brain.parse_nlp = _async_return({})
 
         app_data = {
             "brain": brain,
@@ -767,18 +687,18 @@ class TestEdgeCases:
         }
 
         msg = _make_message("do something")
-        with patch(_PATCH_APP_DATA, return_value=app_data):
-            with patch(_PATCH_MGR, mgr):
-                await handle_natural_language(msg)
+        patched_env(app_data, mgr)
+        await handle_natural_language(msg)
 
         # confidence defaults to 0, command defaults to "unknown"
         # Neither passes the threshold, falls through to single-session
         mgr.send_input.assert_called_once_with("sess-1", "do something")
 
-    async def test_nlp_builds_session_list_json(self):
+    async def test_nlp_builds_session_list_json(self, patched_env):
         """Verify brain.parse_nlp receives correct session_list_json."""
-        s1 = _make_session(id="s1", number=1, alias="alpha", status="running")
-        s2 = _make_session(id="s2", number=2, alias="beta", status="waiting")
+        # Only the fields serialized into session_list_json are needed
+        s1 = SimpleNamespace(id="s1", number=1, alias="alpha", status="running")
+        s2 = SimpleNamespace(id="s2", number=2, alias="beta", status="waiting")
         mgr = _make_manager(sessions=[s1, s2])
 
         brain = AsyncMock()
@@ -793,13 +713,12 @@ class TestEdgeCases:
         }
 
         msg = _make_message("check sessions")
-        with patch(_PATCH_APP_DATA, return_value=app_data):
-            with patch(_PATCH_MGR, mgr):
-                await handle_natural_language(msg)
+        patched_env(app_data, mgr)
+        await handle_natural_language(msg)
 
         brain.parse_nlp.assert_called_once()
         call_kwargs = brain.parse_nlp.call_args[1]
-        session_list = json.loads(call_kwargs["session_list_json"])
+        session_list = _json.loads(call_kwargs["session_list_json"])
         assert len(session_list) == 2
         assert session_list[0]["number"] == 1
         assert session_list[0]["alias"] == "alpha"
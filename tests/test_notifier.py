@@ -1,7 +1,11 @@
 """Tests for Notifier — batching, offline queue, retry, redaction, lifecycle."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
+import pytest
 
 from conductor.bot.notifier import Notifier
 
@@ -13,14 +17,35 @@ def _make_config(batch_window_s=0):
     return cfg
 
 
-def _make_bot(message_id=42):
-    """Create a mock aiogram.Bot whose send_message returns a message with message_id."""
-    bot = AsyncMock()
-    msg = MagicMock()
-    msg.message_id = message_id
-    bot.send_message.return_value = msg
-    bot.get_me.return_value = MagicMock()
-    return bot
+class _FakeBot:
+    """Stand-in aiogram Bot that records calls in plain lists.
+
+    Every ``send_message`` attempt is logged in ``calls`` as
+    ``(chat_id, text, kwargs)``. Each attempt takes the next entry of
+    ``outcomes`` (None succeeds, an exception is raised) and falls back to
+    ``error`` once ``outcomes`` is empty.
+    """
+
+    def __init__(self, message_id: int = 42) -> None:
+        self.message_id = message_id
+        self.calls: list[tuple[int, str, dict]] = []
+        self.outcomes: list[Exception | None] = []
+        self.error: Exception | None = None
+        self.get_me_calls = 0
+        self.get_me_error: Exception | None = None
+
+    async def send_message(self, chat_id, text, **kwargs):
+        self.calls.append((chat_id, text, kwargs))
+        error = self.outcomes.pop(0) if self.outcomes else self.error
+        if error is not None:
+            raise error
+        return SimpleNamespace(message_id=self.message_id)
+
+    async def get_me(self):
+        self.get_me_calls += 1
+        if self.get_me_error is not None:
+            raise self.get_me_error
+        return SimpleNamespace()
 
 
 CHAT_ID = 123456
@@ -33,11 +58,11 @@ class TestSendImmediate:
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=5)
     )
     async def test_send_immediate_bypasses_batch(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
         result = await notifier.send_immediate("urgent message")
         assert result == 42
-        bot.send_message.assert_awaited_once()
+        assert len(bot.calls) == 1
         # Buffer should be empty -- nothing was batched
         assert len(notifier._batch_buffer) == 0
 
@@ -45,28 +70,20 @@ class TestSendImmediate:
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=0)
     )
     async def test_send_immediate_with_reply_markup(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
-        markup = MagicMock()
+        markup = SimpleNamespace()
         await notifier.send_immediate("prompt", reply_markup=markup)
-        call_kwargs = bot.send_message.call_args
-        assert (
-            call_kwargs.kwargs.get("reply_markup") is markup
-            or call_kwargs[1].get("reply_markup") is markup
-        )
+        assert bot.calls[-1][2]["reply_markup"] is markup
 
     @patch(
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=0)
     )
     async def test_send_immediate_with_disable_notification(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
         await notifier.send_immediate("silent", disable_notification=True)
-        call_kwargs = bot.send_message.call_args
-        assert (
-            call_kwargs.kwargs.get("disable_notification") is True
-            or call_kwargs[1].get("disable_notification") is True
-        )
+        assert bot.calls[-1][2]["disable_notification"] is True
 
 
 class TestSendWithZeroBatchWindow:
@@ -76,17 +93,17 @@ class TestSendWithZeroBatchWindow:
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=0)
     )
     async def test_send_immediate_when_window_zero(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
         result = await notifier.send("hello")
         assert result == 42
-        bot.send_message.assert_awaited_once()
+        assert len(bot.calls) == 1
 
     @patch(
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=0)
     )
     async def test_send_returns_message_id_when_window_zero(self, _mock_cfg):
-        bot = _make_bot(message_id=99)
+        bot = _FakeBot(message_id=99)
         notifier = Notifier(bot, CHAT_ID)
         result = await notifier.send("test")
         assert result == 99
@@ -99,24 +116,63 @@ class TestSendWithBatchWindow:
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=5)
     )
     async def test_send_buffers_when_window_positive(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
         result = await notifier.send("buffered message")
         assert result is None
-        bot.send_message.assert_not_awaited()
+        assert bot.calls == []
         assert len(notifier._batch_buffer) == 1
 
     @patch(
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=5)
     )
     async def test_send_buffers_multiple_messages(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
         await notifier.send("msg1")
         await notifier.send("msg2")
         await notifier.send("msg3")
         assert len(notifier._batch_buffer) == 3
-        bot.send_message.assert_not_awaited()
+        assert bot.calls == []
+
+    @patch(
+        "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=5)
+    )
+    async def test_send_flushes_full_batch_early(self, _mock_cfg):
+        bot = _FakeBot()
+        notifier = Notifier(bot, CHAT_ID)
+        for i in range(20):
+            await notifier.send(f"msg{i}")
+        assert bot.calls == []  # scheduled, not awaited by send()
+        await notifier._flush_task
+        assert len(bot.calls) == 1
+        assert "20 Updates" in bot.calls[0][1]
+        assert len(notifier._batch_buffer) == 0
+
+    @patch(
+        "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=5)
+    )
+    async def test_send_flushes_large_batch_early(self, _mock_cfg):
+        bot = _FakeBot()
+        notifier = Notifier(bot, CHAT_ID)
+        await notifier.send("a" * 2000)
+        assert bot.calls == []
+        await notifier.send("b" * 2000)
+        await notifier._flush_task
+        assert len(bot.calls) == 1
+        assert notifier._batch_chars == 0
+
+    @patch(
+        "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=5)
+    )
+    async def test_stop_waits_for_pending_early_flush(self, _mock_cfg):
+        bot = _FakeBot()
+        notifier = Notifier(bot, CHAT_ID)
+        for i in range(20):
+            await notifier.send(f"msg{i}")
+        await notifier.stop()
+        assert notifier._flush_task.done()
+        assert len(bot.calls) == 1
 
 
 class TestRedaction:
@@ -126,10 +182,10 @@ class TestRedaction:
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=0)
     )
     async def test_send_redacts_api_key(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
         await notifier.send("key is sk-ant-REDACTED")
-        sent_text = bot.send_message.call_args[0][1]
+        sent_text = bot.calls[-1][1]
         assert "sk-ant" not in sent_text
         assert "[REDACTED" in sent_text
 
@@ -137,10 +193,10 @@ class TestRedaction:
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=0)
     )
     async def test_send_immediate_redacts_api_key(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
         await notifier.send_immediate("key is sk-ant-REDACTED")
-        sent_text = bot.send_message.call_args[0][1]
+        sent_text = bot.calls[-1][1]
         assert "sk-ant" not in sent_text
         assert "[REDACTED" in sent_text
 
@@ -148,7 +204,7 @@ class TestRedaction:
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=5)
     )
     async def test_send_redacts_before_buffering(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
         await notifier.send("Bearer eyJhbGciOiJIUzI1NiJ9.secret")
         buffered_text = notifier._batch_buffer[0][0]
@@ -163,27 +219,27 @@ class TestFlushBatch:
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=5)
     )
     async def test_flush_single_message(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
         notifier._batch_buffer.append(("single message", {"parse_mode": "HTML"}))
         await notifier._flush_batch()
-        bot.send_message.assert_awaited_once()
-        sent_text = bot.send_message.call_args[0][1]
+        assert len(bot.calls) == 1
+        sent_text = bot.calls[-1][1]
         assert sent_text == "single message"
 
     @patch(
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=5)
     )
     async def test_flush_combines_plain_messages(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
         notifier._batch_buffer.append(("msg1", {"parse_mode": "HTML"}))
         notifier._batch_buffer.append(("msg2", {"parse_mode": "HTML"}))
         notifier._batch_buffer.append(("msg3", {"parse_mode": "HTML"}))
         await notifier._flush_batch()
         # All plain messages combined into one send
-        bot.send_message.assert_awaited_once()
-        sent_text = bot.send_message.call_args[0][1]
+        assert len(bot.calls) == 1
+        sent_text = bot.calls[-1][1]
         assert "3 Updates" in sent_text
         assert "msg1" in sent_text
         assert "msg2" in sent_text
@@ -194,10 +250,10 @@ class TestFlushBatch:
     )
     async def test_flush_keyboard_messages_sent_separately(self, _mock_cfg):
         """C4 fix: messages with reply_markup are not combined."""
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
-        markup1 = MagicMock()
-        markup2 = MagicMock()
+        markup1 = SimpleNamespace()
+        markup2 = SimpleNamespace()
         notifier._batch_buffer.append(
             ("kb1", {"parse_mode": "HTML", "reply_markup": markup1})
         )
@@ -206,16 +262,16 @@ class TestFlushBatch:
         )
         await notifier._flush_batch()
         # Each keyboard message sent individually
-        assert bot.send_message.await_count == 2
+        assert len(bot.calls) == 2
 
     @patch(
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=5)
     )
     async def test_flush_mixed_plain_and_keyboard(self, _mock_cfg):
         """C4 fix: plain messages combined, keyboard messages sent separately."""
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
-        markup = MagicMock()
+        markup = SimpleNamespace()
         notifier._batch_buffer.append(("plain1", {"parse_mode": "HTML"}))
         notifier._batch_buffer.append(("plain2", {"parse_mode": "HTML"}))
         notifier._batch_buffer.append(
@@ -223,21 +279,21 @@ class TestFlushBatch:
         )
         await notifier._flush_batch()
         # 1 combined plain + 1 keyboard = 2 sends
-        assert bot.send_message.await_count == 2
+        assert len(bot.calls) == 2
         # First call should be the combined plain message
-        first_text = bot.send_message.call_args_list[0][0][1]
+        first_text = bot.calls[0][1]
         assert "2 Updates" in first_text
         assert "plain1" in first_text
         assert "plain2" in first_text
         # Second call should be the keyboard message
-        second_text = bot.send_message.call_args_list[1][0][1]
+        second_text = bot.calls[1][1]
         assert second_text == "kb1"
 
     @patch(
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=5)
     )
     async def test_flush_clears_buffer(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
         notifier._batch_buffer.append(("msg", {"parse_mode": "HTML"}))
         await notifier._flush_batch()
@@ -247,30 +303,84 @@ class TestFlushBatch:
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=5)
     )
     async def test_flush_empty_buffer_is_noop(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
         await notifier._flush_batch()
-        bot.send_message.assert_not_awaited()
+        assert bot.calls == []
 
     @patch(
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=5)
     )
     async def test_flush_single_plain_among_keyboards(self, _mock_cfg):
         """A single plain message among keyboard messages is sent as-is (not combined)."""
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
-        markup = MagicMock()
+        markup = SimpleNamespace()
         notifier._batch_buffer.append(("plain1", {"parse_mode": "HTML"}))
         notifier._batch_buffer.append(
             ("kb1", {"parse_mode": "HTML", "reply_markup": markup})
         )
         await notifier._flush_batch()
-        assert bot.send_message.await_count == 2
+        assert len(bot.calls) == 2
         # The single plain message should be sent without "Updates" prefix
-        first_text = bot.send_message.call_args_list[0][0][1]
+        first_text = bot.calls[0][1]
         assert first_text == "plain1"
 
 
+class TestLinger:
+    """_linger defers the flush only while the buffer keeps growing."""
+
+    @patch(
+        "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=1)
+    )
+    async def test_linger_skipped_for_empty_buffer(self, _mock_cfg):
+        notifier = Notifier(_FakeBot(), CHAT_ID)
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        with patch("conductor.bot.notifier.asyncio.sleep", side_effect=fake_sleep):
+            await notifier._linger()
+        assert sleeps == []
+
+    @patch(
+        "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=1)
+    )
+    async def test_linger_returns_once_buffer_is_stable(self, _mock_cfg):
+        notifier = Notifier(_FakeBot(), CHAT_ID)
+        notifier._batch_buffer.append(("msg", {"parse_mode": "HTML"}))
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            # Two more messages arrive during the first two ticks only
+            if len(sleeps) <= 2:
+                notifier._batch_buffer.append(("more", {"parse_mode": "HTML"}))
+
+        with patch("conductor.bot.notifier.asyncio.sleep", side_effect=fake_sleep):
+            await notifier._linger()
+        assert len(sleeps) == 3
+
+    @patch(
+        "conductor.bot.notifier.get_config",
+        return_value=_make_config(batch_window_s=0.1),
+    )
+    async def test_linger_capped_at_one_window(self, _mock_cfg):
+        notifier = Notifier(_FakeBot(), CHAT_ID)
+        notifier._batch_buffer.append(("msg", {"parse_mode": "HTML"}))
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+            notifier._batch_buffer.append(("more", {"parse_mode": "HTML"}))
+
+        with patch("conductor.bot.notifier.asyncio.sleep", side_effect=fake_sleep):
+            await notifier._linger()
+        assert sum(sleeps) >= 0.1
+        assert len(sleeps) == 2
+
+
 class TestOfflineQueueAndRetry:
     """Offline queueing with retry limit (C5 fix)."""
 
@@ -278,20 +388,20 @@ class TestOfflineQueueAndRetry:
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=0)
     )
     async def test_send_failure_queues_message(self, _mock_cfg):
-        bot = _make_bot()
-        bot.send_message.side_effect = Exception("Network error")
+        bot = _FakeBot()
+        bot.error = Exception("Network error")
         notifier = Notifier(bot, CHAT_ID)
         result = await notifier.send("test")
         assert result is None
         assert notifier.is_online is False
-        assert notifier._queue.qsize() == 1
+        assert len(notifier._queue) == 1
 
     @patch(
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=0)
     )
     async def test_send_failure_sets_offline(self, _mock_cfg):
-        bot = _make_bot()
-        bot.send_message.side_effect = Exception("Timeout")
+        bot = _FakeBot()
+        bot.error = Exception("Timeout")
         notifier = Notifier(bot, CHAT_ID)
         await notifier.send("msg")
         assert notifier.is_online is False
@@ -300,7 +410,7 @@ class TestOfflineQueueAndRetry:
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=0)
     )
     async def test_successful_send_sets_online(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
         notifier.is_online = False
         await notifier.send("msg")
@@ -310,60 +420,93 @@ class TestOfflineQueueAndRetry:
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=0)
     )
     async def test_offline_queue_flushed_on_success(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
         # Manually enqueue an offline message
-        await notifier._queue.put(("queued msg", {"parse_mode": "HTML"}, 1))
+        notifier._queue.append(("queued msg", {"parse_mode": "HTML"}, 1, 0.0))
         # Successful send triggers flush
         await notifier.send("new msg")
-        assert notifier._queue.qsize() == 0
+        assert len(notifier._queue) == 0
         # 1 for direct send + 1 for queued message = 2
-        assert bot.send_message.await_count == 2
+        assert len(bot.calls) == 2
 
     @patch(
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=0)
     )
     async def test_message_discarded_after_max_retries(self, _mock_cfg):
         """C5 fix: messages are discarded after 5 retries."""
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
         # Put a message at max retries (5) into the queue
-        await notifier._queue.put(("doomed msg", {"parse_mode": "HTML"}, 5))
+        notifier._queue.append(("doomed msg", {"parse_mode": "HTML"}, 5, 0.0))
         # Flush will try to send, fail, and discard because retries == max_retries
-        bot.send_message.side_effect = Exception("Still broken")
+        bot.error = Exception("Still broken")
         await notifier._flush_offline_queue()
         # Message should be gone (discarded, not re-queued)
-        assert notifier._queue.qsize() == 0
+        assert len(notifier._queue) == 0
 
     @patch(
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=0)
     )
     async def test_message_requeued_under_max_retries(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
-        await notifier._queue.put(("retry msg", {"parse_mode": "HTML"}, 3))
-        bot.send_message.side_effect = Exception("Temporary failure")
+        notifier._queue.append(("retry msg", {"parse_mode": "HTML"}, 3, 0.0))
+        bot.error = Exception("Temporary failure")
         await notifier._flush_offline_queue()
         # Message should be re-queued with retries incremented
-        assert notifier._queue.qsize() == 1
-        text, kwargs, retries = await notifier._queue.get()
+        assert len(notifier._queue) == 1
+        text, kwargs, retries, next_attempt = notifier._queue.popleft()
         assert retries == 4
+        # Retried no sooner than the 2**3 s backoff
+        assert next_attempt >= time.monotonic() + 7
 
     @patch(
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=0)
     )
     async def test_flush_offline_stops_on_first_failure(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
-        await notifier._queue.put(("msg1", {"parse_mode": "HTML"}, 1))
-        await notifier._queue.put(("msg2", {"parse_mode": "HTML"}, 1))
+        notifier._queue.append(("msg1", {"parse_mode": "HTML"}, 1, 0.0))
+        notifier._queue.append(("msg2", {"parse_mode": "HTML"}, 1, 0.0))
         # First call succeeds, second fails
-        msg_mock = MagicMock()
-        msg_mock.message_id = 1
-        bot.send_message.side_effect = [msg_mock, Exception("Fail")]
+        bot.outcomes = [None, Exception("Fail")]
         await notifier._flush_offline_queue()
         # msg2 should still be in the queue (re-queued with retries=2)
-        assert notifier._queue.qsize() == 1
+        assert len(notifier._queue) == 1
+
+    @patch(
+        "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=0)
+    )
+    async def test_concurrent_offline_drains_share_the_queue(self, _mock_cfg):
+        bot = _FakeBot()
+        notifier = Notifier(bot, CHAT_ID)
+        for i in range(3):
+            notifier._queue.append((f"msg{i}", {"parse_mode": "HTML"}, 1, 0.0))
+        await asyncio.gather(
+            notifier._flush_offline_queue(), notifier._flush_offline_queue()
+        )
+        assert sorted(call[1] for call in bot.calls) == ["msg0", "msg1", "msg2"]
+        assert len(notifier._queue) == 0
+
+    @patch(
+        "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=0)
+    )
+    async def test_flush_offline_skips_messages_in_backoff(self, _mock_cfg):
+        bot = _FakeBot()
+        notifier = Notifier(bot, CHAT_ID)
+        later = time.monotonic() + 60
+        notifier._queue.append(("waiting", {"parse_mode": "HTML"}, 2, later))
+        notifier._queue.append(("due", {"parse_mode": "HTML"}, 1, 0.0))
+        await notifier._flush_offline_queue()
+        assert len(bot.calls) == 1
+        assert bot.calls[-1][1] == "due"
+        assert notifier._queue.popleft() == (
+            "waiting",
+            {"parse_mode": "HTML"},
+            2,
+            later,
+        )
 
 
 class TestConnectivityCheck:
@@ -373,7 +516,7 @@ class TestConnectivityCheck:
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=0)
     )
     async def test_connectivity_check_calls_get_me_when_offline(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
         notifier._running = True
         notifier.is_online = False
@@ -390,14 +533,14 @@ class TestConnectivityCheck:
         with patch("conductor.bot.notifier.asyncio.sleep", side_effect=stop_after_one):
             await notifier.connectivity_check()
 
-        bot.get_me.assert_awaited_once()
+        assert bot.get_me_calls == 1
         assert notifier.is_online is True
 
     @patch(
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=0)
     )
     async def test_connectivity_check_skips_when_online(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
         notifier._running = True
         notifier.is_online = True
@@ -413,14 +556,14 @@ class TestConnectivityCheck:
         with patch("conductor.bot.notifier.asyncio.sleep", side_effect=stop_after_one):
             await notifier.connectivity_check()
 
-        bot.get_me.assert_not_awaited()
+        assert bot.get_me_calls == 0
 
     @patch(
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=0)
     )
     async def test_connectivity_check_handles_get_me_failure(self, _mock_cfg):
-        bot = _make_bot()
-        bot.get_me.side_effect = Exception("Still offline")
+        bot = _FakeBot()
+        bot.get_me_error = Exception("Still offline")
         notifier = Notifier(bot, CHAT_ID)
         notifier._running = True
         notifier.is_online = False
@@ -436,7 +579,7 @@ class TestConnectivityCheck:
         with patch("conductor.bot.notifier.asyncio.sleep", side_effect=stop_after_one):
             await notifier.connectivity_check()
 
-        bot.get_me.assert_awaited_once()
+        assert bot.get_me_calls == 1
         # Should remain offline after get_me failure
         assert notifier.is_online is False
 
@@ -448,7 +591,7 @@ class TestStartStopLifecycle:
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=1)
     )
     async def test_start_sets_running_and_creates_task(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
         assert notifier._running is False
         assert notifier._batch_task is None
@@ -462,7 +605,7 @@ class TestStartStopLifecycle:
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=1)
     )
     async def test_stop_cancels_task_and_flushes(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
         await notifier.start()
         # Add a message to the buffer to verify flush on stop
@@ -472,13 +615,13 @@ class TestStartStopLifecycle:
         # Buffer should be flushed
         assert len(notifier._batch_buffer) == 0
         # The pending message should have been sent
-        bot.send_message.assert_awaited()
+        assert bot.calls
 
     @patch(
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=1)
     )
     async def test_stop_without_start_is_safe(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
         # Should not raise even if never started
         await notifier.stop()
@@ -488,11 +631,11 @@ class TestStartStopLifecycle:
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=1)
     )
     async def test_stop_flushes_empty_buffer_gracefully(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
         await notifier.start()
         await notifier.stop()
-        bot.send_message.assert_not_awaited()
+        assert bot.calls == []
 
 
 class TestHTMLParseMode:
@@ -502,27 +645,45 @@ class TestHTMLParseMode:
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=0)
     )
     async def test_send_includes_html_parse_mode(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
         await notifier.send("test")
-        call_kwargs = bot.send_message.call_args
-        assert (
-            call_kwargs.kwargs.get("parse_mode") == "HTML"
-            or call_kwargs[1].get("parse_mode") == "HTML"
-        )
+        assert bot.calls[-1][2]["parse_mode"] == "HTML"
 
     @patch(
         "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=0)
     )
     async def test_send_immediate_includes_html_parse_mode(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
         await notifier.send_immediate("test")
-        call_kwargs = bot.send_message.call_args
-        assert (
-            call_kwargs.kwargs.get("parse_mode") == "HTML"
-            or call_kwargs[1].get("parse_mode") == "HTML"
-        )
+        assert bot.calls[-1][2]["parse_mode"] == "HTML"
+
+    @patch(
+        "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=5)
+    )
+    async def test_plain_sends_share_read_only_kwargs(self, _mock_cfg):
+        notifier = Notifier(_FakeBot(), CHAT_ID)
+        await notifier.send("a")
+        await notifier.send("b")
+        first, second = (kwargs for _, kwargs in notifier._batch_buffer)
+        assert first is second
+        assert dict(first) == {"parse_mode": "HTML"}
+        with pytest.raises(TypeError):
+            first["reply_markup"] = None
+
+    @patch(
+        "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=5)
+    )
+    async def test_keyboard_send_gets_its_own_kwargs(self, _mock_cfg):
+        notifier = Notifier(_FakeBot(), CHAT_ID)
+        markup = SimpleNamespace()
+        await notifier.send("kb", reply_markup=markup, disable_notification=True)
+        assert notifier._batch_buffer[0][1] == {
+            "parse_mode": "HTML",
+            "reply_markup": markup,
+            "disable_notification": True,
+        }
 
 
 class TestInitialization:
@@ -533,7 +694,7 @@ class TestInitialization:
         return_value=_make_config(batch_window_s=10),
     )
     def test_init_reads_batch_window_from_config(self, _mock_cfg):
-        bot = _make_bot()
+        bot = _FakeBot()
         notifier = Notifier(bot, CHAT_ID)
         assert notifier._batch_window == 10
         assert notifier.chat_id == CHAT_ID
@@ -541,3 +702,23 @@ class TestInitialization:
         assert notifier.is_online is True
         assert notifier._running is False
         assert notifier._max_retries == 5
+
+    def test_reload_config_refreshes_batch_window(self):
+        with patch(
+            "conductor.bot.notifier.get_config",
+            return_value=_make_config(batch_window_s=10),
+        ):
+            notifier = Notifier(_FakeBot(), CHAT_ID)
+        with patch(
+            "conductor.bot.notifier.get_config",
+            return_value=_make_config(batch_window_s=0),
+        ):
+            notifier.reload_config()
+        assert notifier._batch_window == 0
+
+    @patch(
+        "conductor.bot.notifier.get_config", return_value=_make_config(batch_window_s=0)
+    )
+    def test_instances_have_no_dict(self, _mock_cfg):
+        notifier = Notifier(_FakeBot(), CHAT_ID)
+        assert not hasattr(notifier, "__dict__")
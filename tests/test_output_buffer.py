@@ -14,42 +14,65 @@ class TestOutputBuffer:
         result = OutputBuffer._strip_ansi(text)
         assert result == "Hello"
 
+    def test_strip_ansi_mixed_sgr_and_cursor(self):
+        text = "\x1b[1;32mOK\x1b[0m\x1b[K done"
+        result = OutputBuffer._strip_ansi(text)
+        assert result == "OK done"
+
     def test_preserves_plain_text(self):
         text = "Hello, world!"
         result = OutputBuffer._strip_ansi(text)
         assert result == text
 
+    def test_strip_ansi_bare_escape(self):
+        text = "\x1bDscrolled\x1bM"
+        result = OutputBuffer._strip_ansi(text)
+        assert result == "scrolled"
+
     def test_rolling_buffer_limit(self):
         buf = OutputBuffer(max_lines=10)
-        buf.rolling_buffer = list(range(15))
-        # Simulate adding more lines
-        buf.rolling_buffer.extend([16, 17])
-        if len(buf.rolling_buffer) > buf.max_lines:
-            buf.rolling_buffer = buf.rolling_buffer[-buf.max_lines :]
+        buf.rolling_buffer = [f"line-{i}" for i in range(15)]
+        assert list(buf.rolling_buffer) == [f"line-{i}" for i in range(5, 15)]
+        # Appending past the limit drops the oldest lines
+        buf.rolling_buffer.extend(["line-16", "line-17"])
         assert len(buf.rolling_buffer) == 10
+        assert buf.rolling_buffer[0] == "line-7"
+
+    def test_tail(self):
+        buf = OutputBuffer()
+        buf.rolling_buffer = ["a", "b", "c"]
+        assert buf.tail(2) == ["b", "c"]
+        assert buf.tail(10) == ["a", "b", "c"]
+        assert buf.tail(0) == []
+
+    def test_instances_have_no_dict(self):
+        assert not hasattr(OutputBuffer(), "__dict__")
 
     def test_reset(self):
         buf = OutputBuffer()
         buf.rolling_buffer = ["line1", "line2"]
-        buf.seen_line_hashes["abc"] = None
+        buf._remember(123)
         buf.last_capture_length = 5
         buf.reset()
-        assert buf.rolling_buffer == []
+        assert len(buf.rolling_buffer) == 0
         assert len(buf.seen_line_hashes) == 0
         assert buf.last_capture_length == 0
 
     def test_hash_cleanup_preserves_recent(self):
         """Deterministic cleanup: oldest hashes removed, newest kept."""
         buf = OutputBuffer()
-        # Insert hashes in known order
+        # Insert hashes in known order; each insert past the cap evicts one
         for i in range(10005):
-            buf.seen_line_hashes[f"hash-{i}"] = None
-        # Simulate cleanup (same logic as get_new_lines)
-        while len(buf.seen_line_hashes) > 10000:
-            buf.seen_line_hashes.popitem(last=False)
+            buf._remember(i)
         assert len(buf.seen_line_hashes) == 10000
         # Oldest should be gone, newest should remain
-        assert "hash-0" not in buf.seen_line_hashes
-        assert "hash-4" not in buf.seen_line_hashes
-        assert "hash-10004" in buf.seen_line_hashes
-        assert "hash-5" in buf.seen_line_hashes
+        assert 0 not in buf.seen_line_hashes
+        assert 4 not in buf.seen_line_hashes
+        assert 10004 in buf.seen_line_hashes
+        assert 5 in buf.seen_line_hashes
+
+    def test_remember_reports_duplicates(self):
+        buf = OutputBuffer()
+        assert buf._remember(7) is True
+        assert buf._remember(7) is False
+        assert len(buf.seen_line_hashes) == 1
@@ -25,6 +25,28 @@ class TestOutputBufferGetNewLines:
         result = buf.get_new_lines(pane)
         assert result == ["Line 3", "Line 4"]
 
+    def test_get_new_lines_strips_only_tail(self, monkeypatch):
+        buf = OutputBuffer()
+        pane = MagicMock()
+        pane.capture_pane.return_value = ["Line 1", "Line 2"]
+        buf.get_new_lines(pane)
+        stripped = []
+
+        def _record(text):
+            stripped.append(text)
+            return text
+
+        monkeypatch.setattr(OutputBuffer, "_strip_ansi", staticmethod(_record))
+        pane.capture_pane.return_value = [
+            "Line 1",
+            "Line 2",
+            "\x1b[1mLine 3\x1b[0m",
+            "Line 4",
+        ]
+        buf.get_new_lines(pane)
+        # Old lines and ESC-free new lines never reach _strip_ansi
+        assert stripped == ["\x1b[1mLine 3\x1b[0m"]
+
     def test_get_new_lines_dedup(self):
         buf = OutputBuffer()
         pane = MagicMock()
@@ -67,27 +89,27 @@ class TestOutputBufferGetNewLines:
         pane = MagicMock()
         pane.capture_pane.return_value = [f"Line {i}" for i in range(10)]
         buf.get_new_lines(pane)
-        assert len(buf.rolling_buffer) == 5
+        assert list(buf.rolling_buffer) == [f"Line {i}" for i in range(5, 10)]
 
     def test_hash_set_pruning(self):
         buf = OutputBuffer()
-        # Fill seen_line_hashes past threshold using OrderedDict
-        from collections import OrderedDict
-
-        buf.seen_line_hashes = OrderedDict((f"hash-{i}", None) for i in range(10001))
+        # Fill seen_line_hashes up to the cap
+        for i in range(10000):
+            buf._remember(i)
         pane = MagicMock()
         pane.capture_pane.return_value = ["new line"]
-        buf.get_new_lines(pane)
-        # Hash dict should be pruned to 10000 (after removing oldest, then adding new)
-        assert len(buf.seen_line_hashes) <= 10001
+        assert buf.get_new_lines(pane) == ["new line"]
+        # Adding the new hash evicted the oldest, keeping the size at the cap
+        assert len(buf.seen_line_hashes) == 10000
+        assert 0 not in buf.seen_line_hashes
 
     def test_reset_clears_all(self):
         buf = OutputBuffer()
         buf.rolling_buffer = ["a", "b"]
-        buf.seen_line_hashes["h1"] = None
-        buf.seen_line_hashes["h2"] = None
+        buf._remember(1)
+        buf._remember(2)
         buf.last_capture_length = 5
         buf.reset()
-        assert buf.rolling_buffer == []
+        assert len(buf.rolling_buffer) == 0
         assert len(buf.seen_line_hashes) == 0
         assert buf.last_capture_length == 0
@@ -1,6 +1,12 @@
 """Tests for auto-responder matching logic — covers _matches and all match types."""
 
-from conductor.auto.responder import AutoResponder
+from conductor.auto.responder import (
+    AutoResponder,
+    _compile_rule_pattern,
+    _contains_absent,
+    _lead_chars,
+    _regex_scanner,
+)
 from conductor.db.models import AutoRule
 
 
@@ -26,6 +32,21 @@ class TestResponderMatching:
         assert self.responder._matches("Proceed? (Y/n)", rule) is True
         assert self.responder._matches("Proceed? (y/N)", rule) is False
 
+    def test_regex_compiled_once_per_pattern(self):
+        rule = AutoRule(id=4, pattern=r"Save \d+ files\?", match_type="regex")
+        self.responder._matches("Save 3 files?", rule)
+        before = _compile_rule_pattern.cache_info()
+        assert self.responder._matches("Save 12 files?", rule) is True
+        after = _compile_rule_pattern.cache_info()
+        assert after.hits == before.hits + 1
+        assert after.misses == before.misses
+
+    def test_edited_regex_takes_effect(self):
+        rule = AutoRule(id=5, pattern=r"^Proceed", match_type="regex")
+        assert self.responder._matches("Proceed?", rule) is True
+        rule.pattern = r"^Abort"
+        assert self.responder._matches("Proceed?", rule) is False
+
     def test_disabled_rule_skipped(self):
         rules = [
             AutoRule(id=1, pattern="(Y/n)", response="y", enabled=False),
@@ -57,3 +78,79 @@ class TestResponderMatching:
         result = self.responder.check("Some text", rules=[])
         assert result.should_respond is False
         assert result.response == ""
+
+    def test_first_match_keeps_rule_order_across_types(self):
+        rules = [
+            AutoRule(id=1, pattern="missing", response="a"),
+            AutoRule(id=2, pattern=r"\(Y/n\)$", response="b", match_type="regex"),
+            AutoRule(id=3, pattern="(Y/n)", response="c"),
+        ]
+        assert self.responder._first_match("Go? (Y/n)", rules).id == 2
+
+    def test_first_match_skips_contains_rules_when_none_occur(self):
+        rules = [
+            AutoRule(id=1, pattern="(Y/n)", response="y"),
+            AutoRule(id=2, pattern="[y/N]", response="n"),
+            AutoRule(id=3, pattern="Ready", response="", match_type="exact"),
+        ]
+        assert self.responder._first_match("Ready", rules).id == 3
+        assert self.responder._first_match("Waiting...", rules) is None
+
+    def test_unknown_match_type_falls_back_to_contains(self):
+        rule = AutoRule(id=1, pattern="(Y/n)", response="y", match_type="glob")
+        assert self.responder._matches("Go? (Y/n)", rule) is True
+        assert self.responder._matches("Go?", rule) is False
+
+    def test_auto_rule_uses_slots(self):
+        assert not hasattr(AutoRule(), "__dict__")
+
+    def test_lead_chars_deduplicated(self):
+        assert _lead_chars(("(Y/n)", "(y/N)", "Save?")) == "(S"
+
+    def test_lead_chars_none_with_empty_pattern(self):
+        assert _lead_chars(("(Y/n)", "")) is None
+        assert _contains_absent("anything", ("(Y/n)", "")) is False
+
+    def test_contains_absent_lead_char_present_but_no_match(self):
+        assert _contains_absent("Go (maybe)", ("(Y/n)",)) is True
+        assert _contains_absent("Go (Y/n)", ("(Y/n)",)) is False
+
+    def test_first_match_all_disabled_never_matches(self, monkeypatch):
+        rules = [
+            AutoRule(id=1, pattern="(Y/n)", response="y", enabled=False),
+            AutoRule(
+                id=2, pattern=".*", response="n", match_type="regex", enabled=False
+            ),
+        ]
+        calls = []
+        monkeypatch.setattr(
+            AutoResponder, "_matches", staticmethod(lambda *a: calls.append(a))
+        )
+        assert self.responder._first_match("Go? (Y/n)", rules) is None
+        assert calls == []
+
+    def test_regex_scanner_fuses_groupless_patterns(self):
+        scanner = _regex_scanner((r"\(Y/n\)$", r"Continue\?"))
+        assert scanner.search("Continue? ") is not None
+        assert scanner.search("nothing here") is None
+
+    def test_regex_scanner_declines_groups_and_invalid(self):
+        assert _regex_scanner((r"(a)\1",)) is None
+        assert _regex_scanner(("[invalid",)) is None
+        assert _regex_scanner(("ok", "(?i)late-global-flag")) is None
+
+    def test_first_match_skips_regex_rules_on_scanner_miss(self, monkeypatch):
+        rules = [
+            AutoRule(id=1, pattern=r"\[y/N\]", response="n", match_type="regex"),
+            AutoRule(id=2, pattern="Ready", response="", match_type="exact"),
+        ]
+        calls = []
+        original = AutoResponder._matches
+
+        def spy(text, rule):
+            calls.append(rule.id)
+            return original(text, rule)
+
+        monkeypatch.setattr(AutoResponder, "_matches", staticmethod(spy))
+        assert self.responder._first_match("Ready", rules).id == 2
+        assert calls == [2]
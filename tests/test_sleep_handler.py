@@ -1,7 +1,7 @@
 """Tests for Mac sleep/wake detection handler."""
 
 import asyncio
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 from conductor.utils.sleep_handler import SleepHandler
 
@@ -74,3 +74,18 @@ class TestSleepHandler:
         await asyncio.sleep(0.15)
         await handler.stop()
         # Should not raise
+
+    def test_last_check_seconds_maps_to_ns(self):
+        handler = SleepHandler()
+        before = handler._last_check_ns
+        handler._last_check -= 10
+        assert abs(before - handler._last_check_ns - 10_000_000_000) < 1_000
+
+    async def test_callback_error_logged_and_swallowed(self):
+        async def bad_callback(duration):
+            raise RuntimeError("callback failed")
+
+        handler = SleepHandler(on_wake_callback=bad_callback)
+        with patch("conductor.utils.sleep_handler.logger") as log:
+            await handler._handle_wake(12.0)
+        log.error.assert_called_once()
@@ -1,5 +1,9 @@
 """Tests for token estimator."""
 
+from unittest.mock import MagicMock
+
+import pytest
+
 from conductor.tokens.estimator import TokenEstimator
 
 
@@ -25,6 +29,13 @@ class TestTokenEstimator:
         total = est.get_usage()
         assert total["used"] == 3
 
+    def test_unknown_session_usage_is_zero(self):
+        est = TokenEstimator()
+        est.on_claude_response("s1")
+        assert est.get_usage("nope")["used"] == 0
+        assert "nope" not in est.message_counts
+        assert est.get_usage()["used"] == 1
+
     def test_percentage_calculation(self):
         est = TokenEstimator()
         # With max_20x tier, limit=900. 720/900 = 80%
@@ -66,8 +77,56 @@ class TestTokenEstimator:
         usage = est.get_usage()
         assert usage["limit"] == 225
 
+    def test_unknown_tier_uses_pro_limit(self):
+        est = TokenEstimator()
+        est.tier = "enterprise"
+        usage = est.get_usage()
+        assert usage["limit"] == 45
+        assert usage["tier"] == "enterprise"
+
     def test_reset_window(self):
         est = TokenEstimator()
         est.on_claude_response("s1")
         est.reset_window()
         assert est.get_usage()["used"] == 0
+
+    def test_tier_change_recomputes_percentage(self):
+        est = TokenEstimator()
+        est.tier = "max_20x"
+        for _ in range(45):
+            est.on_claude_response("s1")
+        assert est.get_usage()["percentage"] == 5
+        est.tier = "pro"
+        assert est.get_usage()["percentage"] == 100
+
+    def test_equal_cutoffs_pick_most_severe(self, monkeypatch):
+        est = TokenEstimator()
+        cfg = MagicMock()
+        cfg.tokens_config = {"warning_pct": 50, "danger_pct": 50, "critical_pct": 50}
+        monkeypatch.setattr("conductor.tokens.estimator.get_config", lambda: cfg)
+        for _ in range(450):
+            est.on_claude_response("s1")
+        assert est.check_thresholds() == "critical"
+
+    def test_threshold_follows_config_change(self, monkeypatch):
+        est = TokenEstimator()
+        cfg = MagicMock()
+        cfg.tokens_config = {}
+        monkeypatch.setattr("conductor.tokens.estimator.get_config", lambda: cfg)
+        est.tier = "pro"
+        for _ in range(27):  # 60% of the pro limit
+            est.on_claude_response("s1")
+        assert est.check_thresholds() is None
+        cfg.tokens_config = {"warning_pct": 50}
+        assert est.check_thresholds() == "warning"
+
+    @pytest.mark.parametrize("used", [41, 44])  # 91% and 97% of the pro limit
+    def test_descending_cutoffs_pick_most_severe(self, monkeypatch, used):
+        est = TokenEstimator()
+        est.tier = "pro"
+        cfg = MagicMock()
+        cfg.tokens_config = {"warning_pct": 95, "danger_pct": 90, "critical_pct": 80}
+        monkeypatch.setattr("conductor.tokens.estimator.get_config", lambda: cfg)
+        for _ in range(used):
+            est.on_claude_response("s1")
+        assert est.check_thresholds() == "critical"